@@ -0,0 +1,10 @@
+class AnimationClip:
+    __slots__ = ("frames", "frame_duration", "duration")
+
+    def __init__(self, frames, fps):
+        self.frames = frames
+        self.frame_duration = 1000 / fps
+        self.duration = self.frame_duration * len(frames)
+
+    def frame_at(self, time):
+        return self.frames[int(time // self.frame_duration) % len(self.frames)]
@@ -0,0 +1,107 @@
+import os
+
+if __name__ == "__main__":
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import glob
+import mmap
+import hashlib
+import pygame
+from config import *
+from gamelog import log
+
+class AssetCache:
+    def __init__(self, directory=ASSET_CACHE_DIR):
+        self.directory = directory
+        self.hashes = {}
+
+    def source_hash(self, path):
+        if path not in self.hashes:
+            with open(path, "rb") as f:
+                self.hashes[path] = hashlib.sha1(f.read()).hexdigest()[:16]
+        return self.hashes[path]
+
+    def _image_file(self, path, size, smooth):
+        mode = "smooth" if smooth else "plain"
+        return os.path.join(self.directory, f"{self.source_hash(path)}_{size[0]}x{size[1]}_{mode}.rgba")
+
+    def _sound_file(self, path, mixer_format):
+        frequency, size, channels = mixer_format
+        return os.path.join(self.directory, f"{self.source_hash(path)}_{frequency}_{size}_{channels}.pcm")
+
+    def _map(self, filename):
+        with open(filename, "rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _write(self, filename, data):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            temp = f"{filename}.{os.getpid()}.tmp"
+            with open(temp, "wb") as f:
+                f.write(data)
+            os.replace(temp, filename)
+        except Exception as e:
+            log.warning("assets", "Could not write asset cache %s: %s", filename, e)
+
+    def load_images(self, path):
+        variants = {}
+        try:
+            pattern = os.path.join(self.directory, f"{self.source_hash(path)}_*.rgba")
+            for filename in glob.glob(pattern):
+                _, dimensions, mode = os.path.basename(filename)[:-5].split("_")
+                size = tuple(int(n) for n in dimensions.split("x"))
+                data = self._map(filename)
+                if len(data) != size[0] * size[1] * 4:
+                    continue
+                variants[(size, mode == "smooth")] = pygame.image.frombuffer(data, size, "RGBA")
+        except Exception as e:
+            log.warning("assets", "Could not read asset cache for %s: %s", path, e)
+        return variants
+
+    def store_image(self, path, size, smooth, surface):
+        self._write(self._image_file(path, size, smooth), pygame.image.tobytes(surface, "RGBA"))
+
+    def load_sound(self, path):
+        mixer_format = pygame.mixer.get_init()
+        try:
+            filename = self._sound_file(path, mixer_format)
+            if os.path.exists(filename):
+                return pygame.mixer.Sound(buffer=self._map(filename))
+        except Exception as e:
+            log.warning("assets", "Could not read asset cache for %s: %s", path, e)
+        return None
+
+    def store_sound(self, path, sound):
+        self._write(self._sound_file(path, pygame.mixer.get_init()), sound.get_raw())
+
+
+def build_asset_cache():
+    from assets import asset_store
+    from levelgenerator import LevelGenerator
+    from level import Level
+    from player import Player
+    from enemy import ENEMY_TYPES, load_frames
+    from item import ITEM_TYPES, load_item_texture
+    from projectile import load_texture
+
+    asset_store.start()
+    for path in SOUND_ASSETS:
+        asset_store.sound(path)
+    for data in ENEMY_TYPES.values():
+        load_frames(data["frames"], data["size"])
+    for data in ITEM_TYPES.values():
+        load_item_texture(data["texture"])
+    load_texture()
+    Player(WIDTH // 2, HEIGHT // 2)
+    generator = LevelGenerator()
+    generator.generate()
+    Level(generator)
+
+
+if __name__ == "__main__":
+    pygame.init()
+    pygame.mixer.init()
+    pygame.display.set_mode((WIDTH, HEIGHT))
+    build_asset_cache()
+    print(f"Asset cache written to {ASSET_CACHE_DIR}")
@@ -0,0 +1,95 @@
+import pygame
+from concurrent.futures import ThreadPoolExecutor
+from config import *
+from assetcache import AssetCache
+from atlas import sprite_atlas
+
+class AssetStore:
+    def __init__(self, image_paths=IMAGE_ASSETS, sound_paths=SOUND_ASSETS, workers=ASSET_LOADER_THREADS):
+        self.image_paths = image_paths
+        self.sound_paths = sound_paths
+        self.workers = workers
+        self.cache = AssetCache()
+        self.futures = {}
+        self.entries = {}
+        self.sounds = {}
+        self.started = False
+
+    def start(self):
+        if self.started:
+            return
+        self.started = True
+
+        executor = ThreadPoolExecutor(max_workers=self.workers)
+        for path in self.image_paths:
+            self.futures[path] = executor.submit(self._load_image_file, path)
+        if pygame.mixer.get_init():
+            for path in self.sound_paths:
+                self.futures[path] = executor.submit(self._load_sound_file, path)
+        executor.shutdown(wait=False)
+
+    def progress(self):
+        if not self.futures:
+            return 1.0
+        done = sum(1 for future in self.futures.values() if future.done())
+        return done / len(self.futures)
+
+    def is_done(self):
+        return all(future.done() for future in self.futures.values())
+
+    def _load_image_file(self, path):
+        variants = self.cache.load_images(path)
+        if variants:
+            return [None, variants]
+        return [pygame.image.load(path), {}]
+
+    def _load_sound_file(self, path):
+        sound = self.cache.load_sound(path)
+        if sound is None:
+            sound = pygame.mixer.Sound(path)
+            self.cache.store_sound(path, sound)
+        return sound
+
+    def _decoded(self, path, loader):
+        future = self.futures.get(path)
+        if future is None:
+            return loader(path)
+        return future.result()
+
+    def _prepared(self, path, size, smooth):
+        if path not in self.entries:
+            self.entries[path] = self._decoded(path, self._load_image_file)
+        entry = self.entries[path]
+        raw, variants = entry
+
+        if size is not None:
+            size = tuple(size)
+        if (size, smooth) not in variants:
+            if raw is None:
+                raw = entry[0] = pygame.image.load(path)
+            if raw.get_bitsize() < 24:
+                raw = entry[0] = raw.convert_alpha()
+            if size is None:
+                surface = raw
+            elif smooth:
+                surface = pygame.transform.smoothscale(raw, size)
+            else:
+                surface = pygame.transform.scale(raw, size)
+            variants[(size, smooth)] = surface
+            if size is not None:
+                self.cache.store_image(path, size, smooth, surface)
+        return variants[(size, smooth)]
+
+    def region(self, path, size=None, smooth=False):
+        key = (path, size, smooth)
+        if key not in sprite_atlas:
+            sprite_atlas.add(key, self._prepared(path, size, smooth))
+        return sprite_atlas.get(key)
+
+    def sound(self, path):
+        if path not in self.sounds:
+            self.sounds[path] = self._decoded(path, self._load_sound_file)
+        return self.sounds[path]
+
+
+asset_store = AssetStore()
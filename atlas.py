@@ -0,0 +1,101 @@
+import pygame
+from config import *
+
+class AtlasRegion:
+    __slots__ = ("sheet", "rect", "_surface", "_mask")
+
+    def __init__(self, sheet, rect):
+        self.sheet = sheet
+        self.rect = rect
+        self._surface = None
+        self._mask = None
+
+    def surface(self):
+        if self._surface is None:
+            self._surface = self.sheet.subsurface(self.rect)
+        return self._surface
+
+    def mask(self):
+        if self._mask is None:
+            self._mask = pygame.mask.from_surface(self.surface())
+        return self._mask
+
+
+class TextureAtlas:
+    def __init__(self, sheet_size=ATLAS_SHEET_SIZE, padding=ATLAS_PADDING):
+        self.sheet_size = sheet_size
+        self.padding = padding
+        self.sheets = []
+        self.shelves = []
+        self.regions = {}
+        self.rotation_tables = {}
+
+    def __contains__(self, key):
+        return key in self.regions
+
+    def get(self, key):
+        return self.regions[key]
+
+    def add(self, key, surface):
+        if key in self.regions:
+            return self.regions[key]
+
+        width, height = surface.get_size()
+        sheet, x, y = self._allocate(width + self.padding, height + self.padding)
+        sheet.blit(surface, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+        region = AtlasRegion(sheet, pygame.Rect(x, y, width, height))
+        if PIXEL_COLLISION:
+            region.mask()
+        self.regions[key] = region
+        return region
+
+    def rotated(self, region, angle):
+        key = (region, "rotated", angle)
+        if key not in self.regions:
+            self.add(key, pygame.transform.rotate(region.surface(), angle))
+        return self.regions[key]
+
+    def rotations(self, region, step=ROTATION_STEP):
+        key = (region, step)
+        if key not in self.rotation_tables:
+            self.rotation_tables[key] = [self.rotated(region, angle) for angle in range(0, 360, step)]
+        return self.rotation_tables[key]
+
+    def flipped(self, region, flip_x, flip_y):
+        key = (region, "flipped", flip_x, flip_y)
+        if key not in self.regions:
+            self.add(key, pygame.transform.flip(region.surface(), flip_x, flip_y))
+        return self.regions[key]
+
+    def _allocate(self, width, height):
+        for sheet, shelves in zip(self.sheets, self.shelves):
+            spot = self._place(sheet, shelves, width, height)
+            if spot:
+                return sheet, spot[0], spot[1]
+
+        size = max(self.sheet_size, width, height)
+        sheet = pygame.Surface((size, size), pygame.SRCALPHA)
+        if pygame.display.get_surface():
+            sheet = sheet.convert_alpha()
+        sheet.fill((0, 0, 0, 0))
+        self.sheets.append(sheet)
+        self.shelves.append([])
+        spot = self._place(sheet, self.shelves[-1], width, height)
+        return sheet, spot[0], spot[1]
+
+    def _place(self, sheet, shelves, width, height):
+        sheet_width, sheet_height = sheet.get_size()
+        for shelf in shelves:
+            y, shelf_height, x = shelf
+            if height <= shelf_height and x + width <= sheet_width:
+                shelf[2] += width
+                return x, y
+
+        y = shelves[-1][0] + shelves[-1][1] if shelves else 0
+        if y + height > sheet_height or width > sheet_width:
+            return None
+        shelves.append([y, height, width])
+        return 0, y
+
+
+sprite_atlas = TextureAtlas()
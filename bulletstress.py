@@ -0,0 +1,65 @@
+import os
+import sys
+import time
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from config import *
+
+STRESS_PHASE = {"pattern": "spiral", "arms": 16, "speed": 1.2, "spin": 7, "ttl": 2000}
+
+def main():
+    bullets = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    random.seed(1)
+
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+
+    from levelgenerator import LevelGenerator
+    from level import Level
+    from player import Player
+    from patterns import fire_pattern
+
+    generator = LevelGenerator(seed=1)
+    rooms = generator.generate()
+    level = Level(generator)
+    player = Player(WIDTH // 2, HEIGHT // 4)
+    level.set_player(player)
+    player.invincible = True
+    player.invincible_timer = float("inf")
+
+    level.current_room = next(room for row in rooms for room in row if room and room.type == "boss")
+    level.populate_sprites()
+    physical_room = level.current_room.physical_room
+    shots = physical_room.enemy_shots
+    origin = (physical_room.width / 2, physical_room.height / 2)
+
+    spin = 0.0
+    update_time = draw_time = 0.0
+    peak = 0
+    for _ in range(frames):
+        if len(shots) < bullets:
+            spin = fire_pattern(shots, STRESS_PHASE, origin, player.rect.center, spin)
+
+        start = time.perf_counter()
+        level.update(player, 16)
+        middle = time.perf_counter()
+        screen.fill(BLACK)
+        level.draw(screen, 0)
+        end = time.perf_counter()
+
+        update_time += middle - start
+        draw_time += end - middle
+        peak = max(peak, len(shots))
+
+    print(f"peak bullets: {peak}, live at end: {len(shots)}")
+    print(f"update: {update_time * 1000 / frames:.2f} ms/frame")
+    print(f"draw:   {draw_time * 1000 / frames:.2f} ms/frame")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,7 @@ class Button:
         self.hover_color = hover_color
         self.is_hovered = False
         self.rect = pygame.Rect(0, 0, self.width, self.height)
+        self.text_surf = font_medium.render(text, True, BLACK)
 
     def update_position(self, x, y):
         self.rect.topleft = (x, y)
@@ -18,9 +19,8 @@ class Button:
         pygame.draw.rect(surface, color, self.rect, border_radius=10)
         pygame.draw.rect(surface, BLACK, self.rect, 2, border_radius=10)
         
-        text_surf = font_medium.render(self.text, True, BLACK)
-        text_rect = text_surf.get_rect(center=self.rect.center)
-        surface.blit(text_surf, text_rect)
+        text_rect = self.text_surf.get_rect(center=self.rect.center)
+        surface.blit(self.text_surf, text_rect)
         
     def check_hover(self, pos):
         self.is_hovered = self.rect.collidepoint(pos)
@@ -0,0 +1,190 @@
+import os
+import sys
+import time
+import atexit
+import zlib
+import queue
+import struct
+import threading
+import numpy as np
+from config import *
+from gamelog import log
+from telemetry import telemetry
+
+def rgb_view(buffer, width, bytesize, order):
+    return buffer[:, :width * bytesize].reshape(buffer.shape[0], width, bytesize)[:, :, order]
+
+def png_chunk(kind, data):
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+def encode_png(rgb, level=CAPTURE_PNG_LEVEL):
+    height, width, _ = rgb.shape
+    rows = np.zeros((height, width * 3 + 1), dtype=np.uint8)
+    rows[:, 1:] = rgb.reshape(height, -1)
+    return (b"\x89PNG\r\n\x1a\n"
+            + png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+            + png_chunk(b"IDAT", zlib.compress(rows.tobytes(), level))
+            + png_chunk(b"IEND", b""))
+
+def encode_y4m(rgb):
+    r, g, b = (rgb[:, :, i].astype(np.float32) for i in range(3))
+    y = 0.299 * r + 0.587 * g + 0.114 * b
+    u = 128 - 0.168736 * r - 0.331264 * g + 0.5 * b
+    v = 128 + 0.5 * r - 0.418688 * g - 0.081312 * b
+    planes = np.clip(np.rint(np.stack((y, u, v))), 0, 255).astype(np.uint8)
+    return b"FRAME\n" + planes.tobytes()
+
+class FrameCapture:
+    def __init__(self, directory=CAPTURE_DIR, fmt=CAPTURE_FORMAT, fps=CAPTURE_FPS, queue_size=CAPTURE_QUEUE_SIZE,
+                 max_gap=CAPTURE_MAX_GAP):
+        self.directory = directory
+        self.format = fmt
+        self.interval = 1 / fps
+        self.fps = fps
+        self.queue_size = queue_size
+        self.max_repeats = int(max_gap * fps)
+        self.recording = False
+        self.writers = []
+        self.path = None
+
+        self.free = None
+        self.frames = None
+        self.next_frame = 0
+        self.repeats = 0
+        self.dropped = 0
+
+    def toggle(self, surface):
+        if self.recording:
+            self.stop()
+        else:
+            self.start(surface)
+
+    def start(self, surface):
+        if self.recording:
+            return
+        self.size = surface.get_size()
+        bytesize = surface.get_bytesize()
+        if bytesize not in (3, 4):
+            log.warning("capture", "Can't capture %d-bit surfaces", surface.get_bitsize())
+            return
+        self.bytesize = bytesize
+        shifts = surface.get_shifts()[:3]
+        if sys.byteorder == "little":
+            self.order = [shift // 8 for shift in shifts]
+        else:
+            self.order = [bytesize - 1 - shift // 8 for shift in shifts]
+
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            if self.format == "png":
+                self.path = os.path.join(self.directory, f"capture-{stamp}")
+                os.makedirs(self.path, exist_ok=True)
+            else:
+                self.path = os.path.join(self.directory, f"capture-{stamp}.y4m")
+        except OSError as e:
+            log.warning("capture", "Can't create capture directory: %s", e)
+            return
+
+        self.free = queue.SimpleQueue()
+        self.frames = queue.SimpleQueue()
+        for _ in range(self.queue_size):
+            self.free.put(np.empty((self.size[1], surface.get_pitch()), dtype=np.uint8))
+        self.next_frame = time.perf_counter()
+        self.repeats = 0
+        self.dropped = 0
+
+        if not self.writers:
+            atexit.register(self.finish)
+        self.writers = [writer for writer in self.writers if writer.is_alive()]
+        layout = (self.size, self.bytesize, self.order)
+        writer = threading.Thread(target=self._run, args=(self.frames, self.free, self.path, self.format, layout),
+                                  name="capture-writer", daemon=True)
+        writer.start()
+        self.writers.append(writer)
+        self.recording = True
+        log.info("capture", "Recording to %s", self.path)
+
+    def _missed_slots(self, now):
+        return max(0, int((now - self.next_frame) / self.interval))
+
+    def frame(self, surface):
+        if not self.recording:
+            return
+        now = time.perf_counter()
+        if now < self.next_frame or surface.get_size() != self.size:
+            return
+        missed = self._missed_slots(now)
+        self.next_frame += (missed + 1) * self.interval
+        self.repeats += missed
+
+        try:
+            buffer = self.free.get_nowait()
+        except queue.Empty:
+            self.dropped += 1
+            self.repeats += 1
+            telemetry.count("capture_dropped")
+            return
+        view = np.frombuffer(surface.get_buffer(), dtype=np.uint8).reshape(buffer.shape)
+        np.copyto(buffer, view)
+        del view
+        self.frames.put((buffer, min(self.repeats, self.max_repeats)))
+        self.repeats = 0
+
+    def stop(self):
+        if not self.recording:
+            return
+        self.recording = False
+        self.repeats += self._missed_slots(time.perf_counter())
+        self.frames.put((None, min(self.repeats, self.max_repeats)))
+        log.info("capture", "Stopped recording to %s (%d frames dropped), finishing in the background",
+                 self.path, self.dropped)
+
+    def finish(self):
+        self.stop()
+        for writer in self.writers:
+            writer.join()
+
+    def _run(self, frames, free, path, fmt, layout):
+        width, height = layout[0]
+        try:
+            if fmt == "png":
+                def write(data, index):
+                    with open(os.path.join(path, f"{index:06d}.png"), "wb") as f:
+                        f.write(data)
+                written, write_time = self._write_frames(frames, free, layout, encode_png, write)
+            else:
+                with open(path, "wb") as f:
+                    f.write(f"YUV4MPEG2 W{width} H{height} F{self.fps}:1 Ip A1:1 C444 XCOLORRANGE=FULL\n".encode())
+                    written, write_time = self._write_frames(frames, free, layout, encode_y4m,
+                                                             lambda data, index: f.write(data))
+        except OSError as e:
+            log.warning("capture", "Capture stopped, can't write %s: %s", path, e)
+            if frames is self.frames:
+                self.recording = False
+            return
+        average = write_time * 1000 / written if written else 0.0
+        log.info("capture", "Saved %d frames to %s (%.1f ms per frame on the writer)", written, path, average)
+
+    def _write_frames(self, frames, free, layout, encode, write):
+        (width, _), bytesize, order = layout
+        last = None
+        written = 0
+        write_time = 0.0
+        while True:
+            buffer, repeats = frames.get()
+            started = time.perf_counter()
+            if last is not None:
+                for _ in range(repeats):
+                    write(last, written)
+                    written += 1
+            if buffer is None:
+                return written, write_time + time.perf_counter() - started
+            last = encode(rgb_view(buffer, width, bytesize, order))
+            free.put(buffer)
+            write(last, written)
+            written += 1
+            write_time += time.perf_counter() - started
+
+
+capture = FrameCapture()
@@ -16,6 +16,36 @@ WIDTH, HEIGHT = 800, 600
 DOOR_INSET = 1 
 WALL_THICKNESS = 50
 DOOR_SIZE = 60
+ROOM_CLEARED = "cleared"
+ROOM_LOCKED = "locked"
+
+#tiles
+TILE_SIZE = 25
+TILE_FLOOR = 0
+TILE_WALL = 1
+TILE_ROCK = 2
+TILE_PIT = 4
+TILE_BLOCKS_MOVEMENT = TILE_WALL | TILE_ROCK | TILE_PIT
+TILE_BLOCKS_SHOTS = TILE_WALL | TILE_ROCK
+OBSTACLE_CLUSTERS = (0, 4)
+OBSTACLE_CLUSTER_SIZE = 3
+
+#navigation
+FLOW_CELL_SIZE = TILE_SIZE
+FLOW_CLEARANCE = 40
+
+#render layers
+LAYER_FLOOR_ITEMS = 0
+LAYER_ENEMIES = 1
+LAYER_PROJECTILES = 2
+LAYER_PLAYER = 3
+LAYER_PARTICLES = 4
+LAYER_HUD = 5
+
+#entity teams
+TEAM_ENEMY = 1
+TEAM_PLAYER_SHOT = 2
+TEAM_ITEM = 4
 
 #player stats
 PLAYER_HP = 8
@@ -39,4 +69,126 @@ SOUND_PLAYER_HURT = "assets/sounds/hurt.mp3"
 SOUND_PLAYER_SHOOT = "assets/sounds/piu.mp3"
 SOUND_PROJECTILE_HIT = "assets/sounds/water_drop.mp3"
 SOUND_DOOR_CLOSE = "assets/sounds/door_close.mp3"
-SOUND_DOOR_OPEN = "assets/sounds/door_open.mp3"
\ No newline at end of file
+SOUND_DOOR_OPEN = "assets/sounds/door_open.mp3"
+SOUND_ASSETS = [
+    SOUND_VICTORY,
+    SOUND_FAILURE,
+    SOUND_PLAYER_HURT,
+    SOUND_PLAYER_SHOOT,
+    SOUND_PROJECTILE_HIT,
+    SOUND_DOOR_CLOSE,
+    SOUND_DOOR_OPEN
+]
+
+#sound channels
+SOUND_CHANNELS = {"player": 3, "enemy": 4, "door": 1, "ui": 1}
+SOUND_MAX_INSTANCES = 3
+
+#assets
+IMAGE_ASSETS = [
+    "assets/floor.jpg",
+    "assets/wall.png",
+    "assets/door_open.jpg",
+    "assets/door_closed.jpg",
+    "assets/heart_icon.png",
+    "assets/sword_icon.png",
+    "assets/boot_icon.png",
+    "assets/vacuum.png",
+    "assets/black_vacuum.png",
+    "assets/explosion.png",
+    "assets/projectile.png",
+    "assets/frames/boss_large.png",
+    "assets/frames/boss_medium.png",
+    "assets/frames/boss_small.png",
+    "assets/items/hp_up.png",
+    "assets/items/speed_up.png",
+    "assets/items/dmg_up.png",
+    "assets/items/upgrade.png",
+    "assets/items/trophy.png"
+] + [f"assets/frames/enemy_{i}.png" for i in range(12)] + [f"assets/frames/enemy_shooter_{i}.png" for i in range(4)]
+ASSET_LOADER_THREADS = 4
+ASSET_CACHE_DIR = ".asset_cache"
+ATLAS_SHEET_SIZE = 1024
+ATLAS_PADDING = 1
+
+#display
+SCALE_MODE = "integer"
+FULLSCREEN_KEY = pygame.K_F11
+
+#idle screens
+LOADING_REFRESH_INTERVAL = 50
+END_SCREEN_SHAKE_INTERVAL = 50
+PAUSE_KEY = pygame.K_p
+MAX_FRAME_DT = 100
+
+#minimap
+MINIMAP_CELL_SIZE = 12
+MINIMAP_GAP = 2
+MINIMAP_BACKGROUND = (0, 0, 0, 128)
+MINIMAP_CURRENT_COLOR = (255, 255, 255)
+MINIMAP_VISITED_COLOR = (150, 150, 150)
+MINIMAP_ADJACENT_COLOR = (70, 70, 70)
+MINIMAP_ROOM_MARKERS = {"treasure": (255, 215, 0), "boss": RED}
+
+#logging
+LOG_DEBUG = 10
+LOG_INFO = 20
+LOG_WARNING = 30
+LOG_ERROR = 40
+LOG_LEVEL = LOG_INFO
+LOG_CATEGORIES = None
+LOG_FILE = "game.log"
+LOG_BUFFER_SIZE = 1024
+LOG_FLUSH_INTERVAL = 1.0
+LOG_ECHO_LEVEL = LOG_WARNING
+
+#telemetry
+TELEMETRY_FILE = "telemetry.jsonl"
+TELEMETRY_FLUSH_INTERVAL = 2.0
+TELEMETRY_FRAME_BUCKETS = 250
+
+#collision
+PIXEL_COLLISION = True
+ROTATION_STEP = 5
+
+#projectiles
+HOMING_TURN_RATE = 0.8
+
+#particles
+PARTICLE_BUDGET = 1500
+PARTICLE_FADE_STEPS = 6
+PARTICLE_DRAG = 0.9
+PARTICLE_FRAME_INTERVAL = 16
+PARTICLE_EFFECTS = {
+    "hit": {"color": (255, 240, 200), "count": 6, "speed": (1, 3), "life": (80, 180), "size": 3},
+    "shot_hit": {"color": (120, 200, 255), "count": 4, "speed": (0.5, 2), "life": (60, 140), "size": 3},
+    "death": {"color": (180, 180, 180), "count": 24, "speed": (0.5, 3), "life": (200, 450), "size": 5},
+    "split": {"color": (220, 60, 50), "count": 40, "speed": (1, 4), "life": (250, 550), "size": 6},
+    "explosion": {"color": (255, 140, 0), "count": 90, "speed": (0.5, 5), "life": (400, 900), "size": 7},
+}
+
+#floors
+RUN_FLOORS = 3
+FLOOR_EXTRA_ENEMIES = 1
+FLOOR_HP_SCALE = 0.25
+
+#netplay
+NET_HOST = "127.0.0.1"
+NET_PORT = 50505
+NET_PLAYERS = 2
+NET_TICK_RATE = 240
+NET_SNAPSHOT_RATE = 30
+NET_POSITION_SCALE = 4
+NET_SNAPSHOT_BUDGET = 1200
+NET_INTERPOLATION_DELAY = 0.1
+NET_STATS_INTERVAL = 5.0
+
+#capture
+CAPTURE_KEY = pygame.K_F9
+CAPTURE_ON_START = False
+CAPTURE_DIR = "captures"
+CAPTURE_FORMAT = "y4m"
+CAPTURE_FPS = 30
+CAPTURE_QUEUE_SIZE = 16
+CAPTURE_MAX_GAP = 10.0
+CAPTURE_PNG_LEVEL = 1
\ No newline at end of file
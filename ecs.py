@@ -0,0 +1,135 @@
+import pygame
+
+class ComponentStore:
+    def __init__(self, *fields):
+        self.fields = fields
+        self.ids = []
+        self.index = {}
+        self.columns = []
+        for field in fields:
+            column = []
+            setattr(self, field, column)
+            self.columns.append(column)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, eid):
+        return eid in self.index
+
+    def add(self, eid, *values):
+        self.index[eid] = len(self.ids)
+        self.ids.append(eid)
+        for column, value in zip(self.columns, values):
+            column.append(value)
+
+    def remove(self, eid):
+        slot = self.index.pop(eid, None)
+        if slot is None:
+            return
+
+        last_eid = self.ids.pop()
+        for column in self.columns:
+            value = column.pop()
+            if slot < len(column):
+                column[slot] = value
+
+        if last_eid != eid:
+            self.ids[slot] = last_eid
+            self.index[last_eid] = slot
+
+    def get(self, eid, field):
+        return getattr(self, field)[self.index[eid]]
+
+    def set(self, eid, field, value):
+        getattr(self, field)[self.index[eid]] = value
+
+
+class EntitySprite(pygame.sprite.DirtySprite):
+    def __init__(self, eid, region, layer):
+        self._layer = layer
+        pygame.sprite.DirtySprite.__init__(self)
+        self.eid = eid
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.set_region(region)
+
+    def set_region(self, region):
+        center = self.rect.center
+        self.region = region
+        self.image = region.sheet
+        self.source_rect = region.rect
+        self.rect = pygame.Rect((0, 0), region.rect.size)
+        self.rect.center = center
+
+
+class World:
+    def __init__(self, room):
+        self.room = room
+        self.next_id = 0
+        self.render_group = None
+        self.graveyard = set()
+
+        self.transform = ComponentStore("x", "y")
+        self.velocity = ComponentStore("vx", "vy")
+        self.health = ComponentStore("hp", "max_hp")
+        self.collider = ComponentStore("width", "height", "team", "contact_damage")
+        self.sprite = ComponentStore("sprite")
+        self.animation = ComponentStore("clip", "phase")
+        self.rotation = ComponentStore("angle", "speed", "base_image", "images")
+        self.lifetime = ComponentStore("ttl")
+        self.chase = ComponentStore("speed")
+        self.shooter = ComponentStore("interval", "last_shot", "homing")
+        self.bounce = ComponentStore("speed", "acceleration", "dir_x", "dir_y", "cooldown")
+        self.splitter = ComponentStore("thresholds", "done", "child_type", "count")
+        self.emitter = ComponentStore("phases", "last_shot", "spin")
+        self.follow = ComponentStore("target")
+        self.pickup = ComponentStore("effect", "type_name")
+        self.enemy = ComponentStore("type_name")
+
+        self.stores = [
+            self.transform, self.velocity, self.health, self.collider, self.sprite,
+            self.animation, self.rotation, self.lifetime, self.chase, self.shooter,
+            self.bounce, self.splitter, self.emitter, self.follow, self.pickup, self.enemy
+        ]
+
+    def create_entity(self, x, y):
+        eid = self.next_id
+        self.next_id += 1
+        self.transform.add(eid, float(x), float(y))
+        return eid
+
+    def add_sprite(self, eid, region, layer):
+        sprite = EntitySprite(eid, region, layer)
+        sprite.rect.center = (int(self.transform.get(eid, "x")), int(self.transform.get(eid, "y")))
+        self.sprite.add(eid, sprite)
+        if self.render_group is not None:
+            self.render_group.add(sprite)
+        return sprite
+
+    def sprites(self):
+        return self.sprite.sprite
+
+    def is_alive(self, eid):
+        return eid in self.transform and eid not in self.graveyard
+
+    def collider_rect(self, eid):
+        slot = self.collider.index[eid]
+        width = self.collider.width[slot]
+        height = self.collider.height[slot]
+        rect = pygame.Rect(0, 0, width, height)
+        rect.center = (int(self.transform.get(eid, "x")), int(self.transform.get(eid, "y")))
+        return rect
+
+    def destroy(self, eid):
+        self.graveyard.add(eid)
+
+    def flush(self):
+        while self.graveyard:
+            eid = self.graveyard.pop()
+            if eid in self.sprite:
+                self.sprite.get(eid, "sprite").kill()
+            was_enemy = eid in self.enemy
+            for store in self.stores:
+                store.remove(eid)
+            if was_enemy:
+                self.room.remove_enemy(eid)
@@ -0,0 +1,51 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from levelgenerator import LevelGenerator
+from enemy import ENEMY_TYPES, load_frames, load_clip, get_glow_image
+from item import ITEM_TYPES, load_item_texture
+from atlas import sprite_atlas
+from gamelog import log
+
+def warm_spawn_assets():
+    for type_name, data in ENEMY_TYPES.items():
+        frames = load_frames(data["frames"], data["size"])
+        if len(frames) > 1:
+            load_clip(type_name)
+        if "rotation_speed" in data:
+            sprite_atlas.rotations(frames[0])
+        if data.get("glow"):
+            get_glow_image(int(data["size"] * 0.6))
+    for data in ITEM_TYPES.values():
+        load_item_texture(data["texture"])
+
+def build_floor(floor, prerender=None, seed=None):
+    started = time.perf_counter()
+    generator = LevelGenerator(floor=floor, seed=seed)
+    generator.generate()
+
+    if prerender:
+        x, y = generator.start_pos
+        start_room = generator.grid[y][x]
+        for room in [start_room] + [room for room in start_room.connections.values() if room]:
+            room.physical_room.background = prerender(room.physical_room)
+
+    log.info("level", "Floor %d generated in %.1f ms", floor, (time.perf_counter() - started) * 1000)
+    return generator
+
+class FloorBuilder:
+    def __init__(self):
+        self.floor = None
+        self.future = None
+
+    def prepare(self, floor, prerender=None, seed=None):
+        self.floor = floor
+        executor = ThreadPoolExecutor(max_workers=1)
+        self.future = executor.submit(build_floor, floor, prerender, seed)
+        executor.shutdown(wait=False)
+
+    def take(self):
+        if not self.future.done():
+            log.warning("level", "Floor %d is still generating, waiting for it", self.floor)
+        generator = self.future.result()
+        self.future = None
+        return generator
@@ -0,0 +1,115 @@
+import pygame
+from collections import deque
+from config import *
+
+NEIGHBOURS = [(0, -1), (0, 1), (-1, 0), (1, 0)]
+FLOW_NEIGHBOURS = [(-1, -1), (1, -1), (-1, 1), (1, 1), (0, -1), (0, 1), (-1, 0), (1, 0)]
+
+class FlowField:
+    def __init__(self, room, cell_size=FLOW_CELL_SIZE, clearance=FLOW_CLEARANCE):
+        self.room = room
+        self.cell_size = cell_size
+        self.clearance = clearance
+        self.cols = -(-room.width // cell_size)
+        self.rows = -(-room.height // cell_size)
+        self.blocked = None
+        self.target_cells = None
+
+        cell_count = self.cols * self.rows
+        self.distances = [-1] * cell_count
+        self.flow_x = [0.0] * cell_count
+        self.flow_y = [0.0] * cell_count
+
+    def rebuild(self):
+        self.blocked = bytearray(self.cols * self.rows)
+        probe = pygame.Rect(0, 0, self.clearance, self.clearance)
+        half_cell = self.cell_size // 2
+
+        for row in range(self.rows):
+            for col in range(self.cols):
+                probe.center = (col * self.cell_size + half_cell, row * self.cell_size + half_cell)
+                if self.room.check_collision(probe):
+                    self.blocked[row * self.cols + col] = 1
+
+        self.target_cells = None
+
+    def cell_at(self, x, y):
+        col = int(x) // self.cell_size
+        row = int(y) // self.cell_size
+        if 0 <= col < self.cols and 0 <= row < self.rows:
+            return row * self.cols + col
+        return None
+
+    def update(self, target_positions):
+        if self.blocked is None:
+            self.rebuild()
+
+        cells = tuple(sorted({cell for cell in (self.cell_at(*pos) for pos in target_positions) if cell is not None}))
+        if not cells or cells == self.target_cells:
+            return
+
+        self.target_cells = cells
+        self._compute_distances(cells)
+        self._compute_flow()
+
+    def _compute_distances(self, targets):
+        cols, rows = self.cols, self.rows
+        blocked = self.blocked
+        distances = [-1] * (cols * rows)
+        for target in targets:
+            distances[target] = 0
+        queue = deque(targets)
+
+        while queue:
+            cell = queue.popleft()
+            row, col = divmod(cell, cols)
+            next_distance = distances[cell] + 1
+            for dx, dy in NEIGHBOURS:
+                nx, ny = col + dx, row + dy
+                if 0 <= nx < cols and 0 <= ny < rows:
+                    neighbour = ny * cols + nx
+                    if distances[neighbour] < 0 and not blocked[neighbour]:
+                        distances[neighbour] = next_distance
+                        queue.append(neighbour)
+
+        self.distances = distances
+
+    def _compute_flow(self):
+        cols, rows = self.cols, self.rows
+        blocked = self.blocked
+        distances = self.distances
+        flow_x = [0.0] * (cols * rows)
+        flow_y = [0.0] * (cols * rows)
+
+        for cell, distance in enumerate(distances):
+            if distance <= 0:
+                continue
+
+            row, col = divmod(cell, cols)
+            best = distance
+            best_dir = None
+            for dx, dy in FLOW_NEIGHBOURS:
+                nx, ny = col + dx, row + dy
+                if not (0 <= nx < cols and 0 <= ny < rows):
+                    continue
+                neighbour_distance = distances[ny * cols + nx]
+                if neighbour_distance < 0 or neighbour_distance >= best:
+                    continue
+                if dx and dy and (blocked[row * cols + nx] or blocked[ny * cols + col]):
+                    continue
+                best = neighbour_distance
+                best_dir = (dx, dy)
+
+            if best_dir:
+                length = (best_dir[0]**2 + best_dir[1]**2) ** 0.5
+                flow_x[cell] = best_dir[0] / length
+                flow_y[cell] = best_dir[1] / length
+
+        self.flow_x = flow_x
+        self.flow_y = flow_y
+
+    def direction_at(self, pos):
+        cell = self.cell_at(*pos)
+        if cell is None or self.distances[cell] <= 0:
+            return None
+        return self.flow_x[cell], self.flow_y[cell]
@@ -0,0 +1,101 @@
+import sys
+import time
+import atexit
+import threading
+from collections import deque
+from config import *
+
+LEVEL_NAMES = {LOG_DEBUG: "DEBUG", LOG_INFO: "INFO", LOG_WARNING: "WARNING", LOG_ERROR: "ERROR"}
+
+class GameLog:
+    def __init__(self, path=LOG_FILE, level=LOG_LEVEL, categories=LOG_CATEGORIES,
+                 capacity=LOG_BUFFER_SIZE, flush_interval=LOG_FLUSH_INTERVAL, echo_level=LOG_ECHO_LEVEL):
+        self.path = path
+        self.categories = categories
+        self.flush_interval = flush_interval
+        self.echo_level = echo_level
+        self.recent = deque(maxlen=capacity)
+        self.pending = deque(maxlen=capacity)
+        self.wake = threading.Event()
+        self.flush_lock = threading.Lock()
+        self.writer = None
+        self.set_level(level)
+
+    def set_level(self, level):
+        self.level = level
+        self.debug = self._debug if level <= LOG_DEBUG else self._discard
+        self.info = self._info if level <= LOG_INFO else self._discard
+        self.warning = self._warning if level <= LOG_WARNING else self._discard
+        self.error = self._error if level <= LOG_ERROR else self._discard
+
+    def _discard(self, category, message, *args):
+        pass
+
+    def _debug(self, category, message, *args):
+        self.log(LOG_DEBUG, category, message, *args)
+
+    def _info(self, category, message, *args):
+        self.log(LOG_INFO, category, message, *args)
+
+    def _warning(self, category, message, *args):
+        self.log(LOG_WARNING, category, message, *args)
+
+    def _error(self, category, message, *args):
+        self.log(LOG_ERROR, category, message, *args)
+
+    def log(self, level, category, message, *args):
+        if level < self.level or (self.categories is not None and category not in self.categories):
+            return
+        record = (time.time(), level, category, message, args)
+        self.recent.append(record)
+        self.pending.append(record)
+        if self.writer is None:
+            self._start_writer()
+
+    def _start_writer(self):
+        self.writer = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self.writer.start()
+        atexit.register(self.flush)
+
+    def _run(self):
+        while True:
+            self.wake.wait(self.flush_interval)
+            self.wake.clear()
+            self.flush()
+
+    def format(self, record):
+        timestamp, level, category, message, args = record
+        if args:
+            try:
+                message = message % args
+            except (TypeError, ValueError, KeyError) as e:
+                message = f"{message} {args!r} (bad format: {e})"
+        clock = time.strftime("%H:%M:%S", time.localtime(timestamp))
+        return f"{clock}.{int(timestamp * 1000) % 1000:03d} {LEVEL_NAMES[level]:<7} [{category}] {message}"
+
+    def flush(self):
+        with self.flush_lock:
+            if not self.pending:
+                return
+            lines = []
+            echoed = []
+            while self.pending:
+                record = self.pending.popleft()
+                line = self.format(record)
+                lines.append(line)
+                if record[1] >= self.echo_level:
+                    echoed.append(line)
+
+            try:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write("\n".join(lines) + "\n")
+            except OSError:
+                echoed = lines
+            if echoed:
+                sys.stderr.write("\n".join(echoed) + "\n")
+
+    def dump(self):
+        return [self.format(record) for record in self.recent]
+
+
+log = GameLog()
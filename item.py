@@ -1,68 +1,42 @@
 import pygame
 from config import *
-
-class Item:
-    def __init__(self, x, y, item_type, texture_path=None):
-        self.type = item_type
-        self.rect = pygame.Rect(x, y, 50, 50)
-        self.collected = False
-
-        try:
-            self.image = pygame.image.load(texture_path).convert_alpha()
-            self.image = pygame.transform.scale(self.image, (50, 50))
-        except:
-            self.image = pygame.Surface((50, 50), pygame.SRCALPHA)
-            pygame.draw.circle(self.image, (255, 255, 0), (15, 15), 15)
-
-    def update(self, player_rect):
-        if not self.collected and self.rect.colliderect(player_rect):
-            self.collected = True
-            return self.apply_effect()
-        return None
-    
-    def apply_effect(self):
-        return {}
-    
-    def draw(self, screen):
-        if not self.collected:
-            screen.blit(self.image, self.rect)
-
-class HealthUpItem(Item):
-    def __init__(self, x, y):
-        super().__init__(x, y, "health_up", "assets/items/hp_up.png")
-    
-    def apply_effect(self):
-        return {"hp_change": 3}  
-
-class SpeedUpItem(Item):
-    def __init__(self, x, y):
-        super().__init__(x, y, "speed_up", "assets/items/speed_up.png")
-    
-    def apply_effect(self):
-        return {"speed_change": 1}  
-
-class DamageUpItem(Item):
-    def __init__(self, x, y):
-        super().__init__(x, y, "damage_up", "assets/items/dmg_up.png")
-    
-    def apply_effect(self):
-        return {"damage_change": 1}  
-        
-class Upgrade(Item):
-    def __init__(self, x, y):
-        super().__init__(x, y, "upgrade", "assets/items/upgrade.png")
-
-    def apply_effect(self):
-        return {
+from assets import asset_store
+from atlas import sprite_atlas
+
+ITEM_TYPES = {
+    "health_up": {"texture": "assets/items/hp_up.png", "effect": {"hp_change": 3}},
+    "speed_up": {"texture": "assets/items/speed_up.png", "effect": {"speed_change": 1}},
+    "damage_up": {"texture": "assets/items/dmg_up.png", "effect": {"damage_change": 1}},
+    "upgrade": {
+        "texture": "assets/items/upgrade.png",
+        "effect": {
             "hp_change": 3, 
             "speed_change": 1, 
             "damage_change": 1,
             "upgrade": True 
         }
+    },
+    "trophy": {"texture": "assets/items/trophy.png", "effect": {"win_game": True}},
+}
+
+TREASURE_ITEMS = ["health_up", "speed_up", "damage_up", "upgrade"]
 
-class TrophyItem(Item):
-    def __init__(self, x, y):
-        super().__init__(x, y, "trophy", "assets/items/trophy.png")
-    
-    def apply_effect(self):
-        return {"win_game": True}
+_textures = {}
+
+def load_item_texture(path):
+    if path not in _textures:
+        try:
+            _textures[path] = asset_store.region(path, size=(50, 50))
+        except:
+            surf = pygame.Surface((50, 50), pygame.SRCALPHA)
+            pygame.draw.circle(surf, (255, 255, 0), (15, 15), 15)
+            _textures[path] = sprite_atlas.add(path, surf)
+    return _textures[path]
+
+def spawn_item(world, type_name, x, y):
+    data = ITEM_TYPES[type_name]
+    eid = world.create_entity(x + 25, y + 25)
+    world.collider.add(eid, 50, 50, TEAM_ITEM, 0)
+    world.pickup.add(eid, data["effect"], type_name)
+    world.add_sprite(eid, load_item_texture(data["texture"]), LAYER_FLOOR_ITEMS)
+    return eid
\ No newline at end of file
@@ -1,102 +1,381 @@
 import pygame
 from config import *
+from gamelog import log
+from telemetry import telemetry
 from enemy import *
 from item import *
+from rendergroup import RenderGroup
+from systems import update_world
+from soundbank import sound_bank
+from assets import asset_store
+from atlas import sprite_atlas, AtlasRegion
+from floors import FloorBuilder, warm_spawn_assets
+
+class HudLabel(pygame.sprite.DirtySprite):
+    _layer = LAYER_HUD
+
+    def __init__(self, font_size, **anchor):
+        pygame.sprite.DirtySprite.__init__(self)
+        self.font = pygame.font.Font(None, font_size)
+        self.anchor = anchor
+        self.text = None
+        self.image = pygame.Surface((0, 0))
+        self.rect = self.image.get_rect(**anchor)
+        self.visible = 0
+
+    def set_text(self, text):
+        if text == self.text:
+            return
+        self.text = text
+        self.visible = int(text is not None)
+        if text is not None:
+            self.image = self.font.render(text, True, (255, 255, 255))
+            self.rect = self.image.get_rect(**self.anchor)
+
+
+class StatsPanel(pygame.sprite.DirtySprite):
+    _layer = LAYER_HUD
+
+    def __init__(self, heart_icon, sword_icon, boot_icon):
+        pygame.sprite.DirtySprite.__init__(self)
+        self.font = pygame.font.Font(None, 28)
+        self.icons = (heart_icon, sword_icon, boot_icon)
+        self.stats = None
+        self.image = pygame.Surface((80, 100), pygame.SRCALPHA)
+        self.rect = self.image.get_rect(top=10, right=WIDTH - 10)
+
+    def set_stats(self, hp, damage, speed):
+        stats = (hp, damage, speed)
+        if stats == self.stats:
+            return
+        self.stats = stats
+
+        self.image.fill((0, 0, 0, 128))
+        texts = (f"{hp}", f"{damage}", f"{speed:.1f}")
+        for i, (icon, text) in enumerate(zip(self.icons, texts)):
+            y = 10 + i * 30
+            if icon:
+                self.image.blit(icon.sheet, (10, y), icon.rect)
+            self.image.blit(self.font.render(text, True, (255, 255, 255)), (40, y))
+
+
+class Minimap(pygame.sprite.DirtySprite):
+    _layer = LAYER_HUD
+
+    def __init__(self, rooms):
+        pygame.sprite.DirtySprite.__init__(self)
+        self.rooms = rooms
+        self.step = MINIMAP_CELL_SIZE + MINIMAP_GAP
+        width = len(rooms[0]) * self.step + MINIMAP_GAP
+        height = len(rooms) * self.step + MINIMAP_GAP
+        self.image = pygame.Surface((width, height), pygame.SRCALPHA)
+        self.image.fill(MINIMAP_BACKGROUND)
+        self.rect = self.image.get_rect(bottomright=(WIDTH - 10, HEIGHT - 10))
+
+        self.current = None
+        self.visited = set()
+        self.known = set()
+
+    def enter(self, room):
+        changed = {room.position}
+        if self.current:
+            changed.add(self.current.position)
+        self.current = room
+        self.visited.add(room.position)
+        self.known.add(room.position)
+
+        for neighbour in room.connections.values():
+            if neighbour and neighbour.position not in self.known:
+                self.known.add(neighbour.position)
+                changed.add(neighbour.position)
+
+        for position in changed:
+            self._draw_cell(position)
+
+    def _draw_cell(self, position):
+        x, y = position
+        cell = pygame.Rect(MINIMAP_GAP + x * self.step, MINIMAP_GAP + y * self.step,
+                           MINIMAP_CELL_SIZE, MINIMAP_CELL_SIZE)
+        self.image.fill(MINIMAP_BACKGROUND, cell)
+        if position not in self.known:
+            return
+
+        if self.current and position == self.current.position:
+            color = MINIMAP_CURRENT_COLOR
+        elif position in self.visited:
+            color = MINIMAP_VISITED_COLOR
+        else:
+            color = MINIMAP_ADJACENT_COLOR
+        self.image.fill(color, cell)
+
+        marker = MINIMAP_ROOM_MARKERS.get(self.rooms[y][x].type)
+        if marker:
+            self.image.fill(marker, cell.inflate(-6, -6))
+
+
+class RoomPainter:
+    def __init__(self, floor, wall, door, door_closed, rock, pit):
+        self.floor = floor
+        self.wall = wall
+        self.door = door
+        self.door_closed = door_closed
+        self.rock = rock
+        self.pit = pit
+
+    def detached(self):
+        regions = []
+        for region in (self.floor, self.wall, self.door, self.door_closed, self.rock, self.pit):
+            if region is None:
+                regions.append(None)
+            else:
+                surface = region.surface().copy()
+                regions.append(AtlasRegion(surface, surface.get_rect()))
+        return RoomPainter(*regions)
+
+    def render(self, room):
+        background = pygame.Surface((room.width, room.height))
+
+        if self.floor:
+            tw, th = self.floor.rect.size
+            for x in range(0, room.width, tw):
+                for y in range(0, room.height, th):
+                    background.blit(self.floor.sheet, (x, y), self.floor.rect)
+        else:
+            background.fill((50, 50, 50))
+
+        for wall in room.walls:
+            wall_surface = background.subsurface(wall)
+            if self.wall:
+                tw, th = self.wall.rect.size
+                for x in range(0, wall.width, tw):
+                    for y in range(0, wall.height, th):
+                        wall_surface.blit(self.wall.sheet, (x, y), self.wall.rect)
+            else:
+                wall_surface.fill((100, 100, 100))
+
+        for cell, tile in enumerate(room.tiles):
+            row, col = divmod(cell, room.cols)
+            if tile == TILE_ROCK:
+                background.blit(self.rock.sheet, (col * TILE_SIZE, row * TILE_SIZE), self.rock.rect)
+            elif tile == TILE_PIT:
+                background.blit(self.pit.sheet, (col * TILE_SIZE, row * TILE_SIZE), self.pit.rect)
+
+        for direction, door in room.doors:
+            if room.is_locked and self.door_closed:
+                door_texture = self.door_closed
+            else:
+                door_texture = self.door
+
+            if door_texture: 
+                rotated = door_texture.surface()
+
+                if direction == "down":
+                    rotated = pygame.transform.rotate(rotated, 180)
+                elif direction == "right":
+                    rotated = pygame.transform.rotate(rotated, -90)
+                elif direction == "left":
+                    rotated = pygame.transform.rotate(rotated, 90)
+
+                background.blit(pygame.transform.scale(rotated, (door.width, door.height)), door)
+            else:
+                pygame.draw.rect(background, (139, 69, 19), door)
+
+        return background
+
+
+def load_room_painter(tile_size=128):
+    try:
+        tile = (tile_size, tile_size)
+        floor = asset_store.region('assets/floor.jpg', size=tile, smooth=True)
+        wall = asset_store.region('assets/wall.png', size=tile, smooth=True)
+        door = asset_store.region('assets/door_open.jpg', size=tile, smooth=True)
+        door_closed = asset_store.region('assets/door_closed.jpg', size=tile, smooth=True)
+    except Exception as e:
+        log.warning("assets", "Failed to load textures: %s", e)
+        floor = wall = door = door_closed = None
+
+    rock = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+    pygame.draw.ellipse(rock, (85, 80, 75), (1, 2, TILE_SIZE - 2, TILE_SIZE - 3))
+    pygame.draw.ellipse(rock, (130, 124, 116), (4, 3, TILE_SIZE - 10, TILE_SIZE - 11))
+
+    pit = pygame.Surface((TILE_SIZE, TILE_SIZE))
+    pit.fill((15, 10, 8))
+    pygame.draw.rect(pit, (45, 30, 20), pit.get_rect(), 2)
+
+    return RoomPainter(floor, wall, door, door_closed, sprite_atlas.add("rock", rock), sprite_atlas.add("pit", pit))
+
+def load_stats_panel():
+    try:
+        heart_icon = asset_store.region('assets/heart_icon.png', size=(30, 30))
+        sword_icon = asset_store.region('assets/sword_icon.png', size=(30, 30))
+        boot_icon = asset_store.region('assets/boot_icon.png', size=(20, 20))
+    except Exception as e:
+        log.warning("assets", "Failed to load textures: %s", e)
+        heart_icon = sword_icon = boot_icon = None
+    return StatsPanel(heart_icon, sword_icon, boot_icon)
+
 
 class Level:
-    def __init__(self, generator):
+    def __init__(self, generator, floor=1):
+        self.painter = load_room_painter()
+
+        self.player = None
+        self.players = []
+        self.sprites = RenderGroup()
+        self.room_label = HudLabel(24, topleft=(20, 20))
+        self.timer_label = HudLabel(36, center=(int(WIDTH // 1.5), 30))
+        self.stats_panel = load_stats_panel()
+        self.floor_builder = FloorBuilder()
+
+        self.offset_x = 0
+        self.offset_y = 0
+        self.set_floor(generator, floor)
+
+    def set_floor(self, generator, floor):
+        self.floor = floor
+        self.random = generator.random
         self.rooms = generator.grid
         self.current_room_pos = generator.start_pos
-        
-        self.load_textures()
-        self.load_sounds()
+        self.minimap = Minimap(self.rooms)
     
-        print(f"Trying to access room at: {self.current_room_pos}")
-        print(f"Grid size: {len(generator.grid[0])}x{len(generator.grid)}")
+        log.debug("level", "Trying to access room at: %s", self.current_room_pos)
+        log.debug("level", "Grid size: %dx%d", len(generator.grid[0]), len(generator.grid))
     
         self.current_room = self.rooms[self.current_room_pos[1]][self.current_room_pos[0]]
     
         if self.current_room is None:
             for y in range(len(self.rooms)):
                 for x in range(len(self.rooms[0])):
-                    print(f"({x},{y}): {'Room' if self.rooms[y][x] else 'None'}")
+                    log.error("level", "(%d,%d): %s", x, y, 'Room' if self.rooms[y][x] else 'None')
             raise ValueError("Start room not found!")
     
-        self.offset_x = 0
-        self.offset_y = 0
-        self.calculate_offsets()
+        for row in self.rooms:
+            for room in row:
+                if room:
+                    room.physical_room.subscribe(self.on_room_event)
     
-    def load_textures(self, tile_size=128):
-        try:
-            original_floor = pygame.image.load('assets/floor.jpg').convert()
-            self.floor_texture = pygame.transform.smoothscale(original_floor, (tile_size, tile_size))
-            
-            original_wall = pygame.image.load('assets/wall.png').convert()
-            self.wall_texture = pygame.transform.smoothscale(original_wall, (tile_size, tile_size))
-            
-            original_door = pygame.image.load('assets/door_open.jpg').convert()
-            self.door_texture = pygame.transform.smoothscale(original_door, (tile_size, tile_size))
-
-            original_door_closed = pygame.image.load('assets/door_closed.jpg').convert()
-            self.door_closed_texture = pygame.transform.smoothscale(original_door_closed, (tile_size, tile_size))
-
-            self.heart_icon = pygame.image.load('assets/heart_icon.png').convert_alpha()
-            self.sword_icon = pygame.image.load('assets/sword_icon.png').convert_alpha()
-            self.boot_icon = pygame.image.load('assets/boot_icon.png').convert_alpha()
-         
-            self.heart_icon = pygame.transform.scale(self.heart_icon, (30, 30))
-            self.sword_icon = pygame.transform.scale(self.sword_icon, (30, 30))
-            self.boot_icon = pygame.transform.scale(self.boot_icon, (20, 20))
-            
-        except Exception as e:
-            print(f"Failed to load textures: {e}")
-            self.floor_texture = None
-            self.wall_texture = None
-            self.door_texture = None
-            self.door_closed_texture = None
-            self.heart_icon = None
-            self.sword_icon = None
-            self.boot_icon = None
-    
-    def load_sounds(self):
-        try:
-            self.door_close_sound = pygame.mixer.Sound(SOUND_DOOR_CLOSE)
-            self.door_open_sound = pygame.mixer.Sound(SOUND_DOOR_OPEN)
-            self.door_close_sound.set_volume(0.5)
-            self.door_open_sound.set_volume(0.5)
-        except Exception as e:
-            print(f"Could not load door sounds: {e}")
-            self.door_close_sound = None
-            self.door_open_sound = None
+        self.minimap.enter(self.current_room)
+        self.room_entered_at = pygame.time.get_ticks()
+
+        self.calculate_offsets()
+        self.populate_sprites()
+
+    def prepare_next_floor(self):
+        if self.floor < RUN_FLOORS:
+            warm_spawn_assets()
+            self.floor_builder.prepare(self.floor + 1, self.painter.detached().render, self.random.getrandbits(32))
+
+    def is_last_floor(self):
+        return self.floor >= RUN_FLOORS
+
+    def advance_floor(self):
+        if self.floor_builder.future is None:
+            self.prepare_next_floor()
+        generator = self.floor_builder.take()
 
+        self.current_room.physical_room.world.render_group = None
+        self.set_floor(generator, self.floor + 1)
+        telemetry.emit("floor_enter", floor=self.floor)
+        telemetry.emit("room_enter", room=list(self.current_room.position), type=self.current_room.type)
+
+        for member in self.players:
+            member.rect.center = self.current_room.physical_room.rect.center
+            member.float_x = member.rect.centerx
+            member.float_y = member.rect.centery
+            member.can_move = False
+            member.last_update = pygame.time.get_ticks()
+
+        self.prepare_next_floor()
+
+    def shift_timers(self, ms):
+        self.room_entered_at += ms
+        world = self.current_room.physical_room.world
+        for store in (world.shooter, world.emitter):
+            for slot in range(len(store)):
+                store.last_shot[slot] += ms
+        for member in self.players:
+            member.shift_timers(ms)
+
+    def set_player(self, player):
+        self.player = player
+        self.players = [player]
+        self.populate_sprites()
+
+    def add_player(self, player):
+        self.players.append(player)
+        self.populate_sprites()
+
+    def populate_sprites(self):
+        world = self.current_room.physical_room.world
+        world.render_group = self.sprites
+        self.sprites.empty()
+        self.sprites.batches = {
+            LAYER_PROJECTILES: self.current_room.physical_room.enemy_shots,
+            LAYER_PARTICLES: self.current_room.physical_room.particles,
+        }
+        self.sprites.add(world.sprites())
+        self.sprites.add(self.players)
+        self.sprites.add(self.room_label, self.timer_label, self.stats_panel, self.minimap)
+
+    def on_room_event(self, room, event, data):
+        if event == "state_changed":
+            room.background = None
+            if data == ROOM_CLEARED:
+                if room is self.current_room.physical_room:
+                    sound_bank.play(SOUND_DOOR_OPEN, "door", 0.5)
+                    telemetry.emit("room_cleared", room=list(self.current_room.position), type=room.type,
+                                   clear_ms=pygame.time.get_ticks() - self.room_entered_at)
+                    telemetry.count("rooms_cleared")
+                if room.type == "boss":
+                    spawn_item(room.world, "trophy", room.width//2, room.height//2)
+    
     def calculate_offsets(self):
         if self.current_room is None:
-            print("Error: current_room equals None!")
+            log.error("level", "current_room equals None!")
             return
     
         if not hasattr(self.current_room, 'physical_room'):
-            print("Error: current_room have no physical_room attribute!")
+            log.error("level", "current_room have no physical_room attribute!")
             return
     
         self.offset_x = (WIDTH - self.current_room.physical_room.width) // 2
         self.offset_y = (HEIGHT - self.current_room.physical_room.height) // 2
     
-    def check_collision(self, rect: pygame.Rect) -> bool:
-        return self.current_room.physical_room.check_collision(rect)
+    def get_room_background(self, room):
+        if room.background is None:
+            room.background = self._render_room_background(room)
+        return room.background
+
+    def _render_room_background(self, room):
+        return self.painter.render(room)
+
+    def check_collision(self, rect: pygame.Rect, mask: int = TILE_BLOCKS_MOVEMENT) -> bool:
+        return self.current_room.physical_room.check_collision(rect, mask)
+
+    def update(self, player, dt):
+        room = self.current_room.physical_room
+        targets = [member.rect.center for member in self.players if not member.dead] or [player.rect.center]
+        room.flow_field.update(targets)
+        return update_world(room.world, self.players, dt)
     
     def change_room(self, direction: str, player):
-        if any(enemy.alive for enemy in self.current_room.physical_room.enemies):
+        if self.current_room.physical_room.is_locked:
             return False
 
         if self.current_room.connections[direction]:
             new_room = self.current_room.connections[direction]
+            self.current_room.physical_room.world.render_group = None
             self.current_room = new_room
             self.current_room_pos = new_room.position
+            self.minimap.enter(new_room)
+            self.room_entered_at = pygame.time.get_ticks()
+            telemetry.emit("room_enter", room=list(new_room.position), type=new_room.type)
+            telemetry.count("rooms_entered")
             self.calculate_offsets()
+            self.populate_sprites()
 
-            if any(enemy.alive for enemy in self.current_room.physical_room.enemies):
-                if self.door_close_sound:
-                    self.door_close_sound.play()
+            if self.current_room.physical_room.is_locked:
+                sound_bank.play(SOUND_DOOR_CLOSE, "door", 0.5)
 
             room = self.current_room.physical_room
             wall_thickness = room.wall_thickness 
@@ -113,145 +392,39 @@ class Level:
                 player.rect.left = room.rect.left + wall_thickness + 2*DOOR_INSET
                 player.rect.centery = room.rect.centery
 
-            player.float_x = player.rect.centerx
-            player.float_y = player.rect.centery
-
-            player.can_move = False
+            for member in self.players:
+                member.rect.center = player.rect.center
+                member.float_x = player.rect.centerx
+                member.float_y = player.rect.centery
+                member.can_move = False
+                member.last_update = pygame.time.get_ticks()
             return True
         return False
     
     def draw(self, screen, elapsed_time=None):
         room = self.current_room.physical_room
 
-        has_living_enemies = any(enemy.alive for enemy in room.enemies)
-
-        previous_enemies_state = hasattr(self, '_previous_enemies_alive') and self._previous_enemies_alive
-        current_enemies_state = any(enemy.alive for enemy in room.enemies)
-
-        if previous_enemies_state and not current_enemies_state and hasattr(self, 'door_open_sound'):
-            self.door_open_sound.play()
-
-        self._previous_enemies_alive = current_enemies_state
-
-        if room.type == "boss" and not any(enemy.alive for enemy in room.enemies):
-            if not any(isinstance(item, TrophyItem) for item in room.items):
-                room.items.append(TrophyItem(room.width//2, room.height//2))
-
-        if self.floor_texture:
-            floor_surface = pygame.Surface((room.width, room.height))
-            tw, th = self.floor_texture.get_size()
-        
-            for x in range(0, room.width, tw):
-                for y in range(0, room.height, th):
-                    floor_surface.blit(self.floor_texture, (x, y))
-        
-            screen.blit(floor_surface, (self.offset_x, self.offset_y))
-        else:
-            pygame.draw.rect(screen, (50, 50, 50), 
-                           (self.offset_x, self.offset_y, room.width, room.height))
-
-        for wall in room.walls:
-            if self.wall_texture:
-                wall_surface = pygame.Surface((wall.width, wall.height))
-                tw, th = self.wall_texture.get_size()
-            
-                for x in range(0, wall.width, tw):
-                    for y in range(0, wall.height, th):
-                        wall_surface.blit(self.wall_texture, (x, y))
-            
-                screen.blit(wall_surface, (wall.x + self.offset_x, wall.y + self.offset_y))
-            else:
-                pygame.draw.rect(screen, (100, 100, 100), 
-                               (wall.x + self.offset_x, wall.y + self.offset_y, 
-                                wall.width, wall.height))
-
-        for direction, door in room.doors:
-            if has_living_enemies and self.door_closed_texture:
-                door_texture = self.door_closed_texture
-            else:
-                door_texture = self.door_texture
-
-            if door_texture: 
-                rotated = door_texture  
-
-                if direction == "down":
-                    rotated = pygame.transform.rotate(rotated, 180)
-                elif direction == "right":
-                    rotated = pygame.transform.rotate(rotated, -90)
-                elif direction == "left":
-                    rotated = pygame.transform.rotate(rotated, 90)
-
-                scaled_door = pygame.transform.scale(rotated, (door.width, door.height))
-                screen.blit(scaled_door, (door.x + self.offset_x, door.y + self.offset_y))
-            else:
-                pygame.draw.rect(screen, (139, 69, 19), 
-                               (door.x + self.offset_x, door.y + self.offset_y,
-                                door.width, door.height))
-    
-        font = pygame.font.Font(None, 24)
-        room_info = font.render(f"Room: {self.current_room.type}", True, (255, 255, 255))
-        screen.blit(room_info, (20, 20))
+        screen.blit(self.get_room_background(room), (self.offset_x, self.offset_y))
 
-        self.draw_timer(screen, elapsed_time)
-        self.draw_player_stats(screen)
+        self.update_hud(elapsed_time)
+        self.sprites.draw(screen)
 
-        room.enemies = [e for e in room.enemies if e.alive]
-        for enemy in room.enemies:
-            enemy.draw(screen)
-        for item in self.current_room.physical_room.items:
-            item.draw(screen)
+    def update_hud(self, elapsed_time):
+        self.room_label.set_text(f"Floor {self.floor}  Room: {self.current_room.type}")
 
-    def draw_timer(self, screen, elapsed_time):
         if elapsed_time is None:
-            return
-    
-        minutes = elapsed_time // 60
-        seconds = elapsed_time % 60
-        time_text = f"{minutes:02d}:{seconds:02d}"
-    
-        timer_font = pygame.font.Font(None, 36)
-    
-        timer_surface = timer_font.render(time_text, True, (255, 255, 255))
-    
-        timer_bg = pygame.Surface((100, 40), pygame.SRCALPHA)
-        timer_bg.fill((0, 0, 0, 0)) 
-    
-        bg_rect = timer_bg.get_rect(top=10, centerx=WIDTH//1.5)
-        text_rect = timer_surface.get_rect(center=bg_rect.center)
-    
-        screen.blit(timer_bg, bg_rect)
-        screen.blit(timer_surface, text_rect)
+            self.timer_label.set_text(None)
+        else:
+            minutes = elapsed_time // 60
+            seconds = elapsed_time % 60
+            self.timer_label.set_text(f"{minutes:02d}:{seconds:02d}")
 
-    def draw_player_stats(self, screen):
-        stats_font = pygame.font.Font(None, 28)
-        stats_bg = pygame.Surface((80, 100), pygame.SRCALPHA)
-        stats_bg.fill((0, 0, 0, 128))
-    
-        bg_rect = stats_bg.get_rect(top=10, right=WIDTH - 10)
-        screen.blit(stats_bg, bg_rect)
-    
-        icon_x = bg_rect.left + 10
-        text_x = icon_x + 30
-        y_offset = 10
-    
-        if hasattr(self, 'heart_icon') and self.heart_icon:
-            screen.blit(self.heart_icon, (icon_x, bg_rect.top + y_offset))
-        hp_text = stats_font.render(f"{self.player.hp}", True, (255, 255, 255))
-        screen.blit(hp_text, (text_x, bg_rect.top + y_offset))
-    
-        if hasattr(self, 'sword_icon') and self.sword_icon:
-            screen.blit(self.sword_icon, (icon_x, bg_rect.top + y_offset + 30))
-        damage_text = stats_font.render(f"{self.player.damage}", True, (255, 255, 255))
-        screen.blit(damage_text, (text_x, bg_rect.top + y_offset + 30))
-    
-        if hasattr(self, 'boot_icon') and self.boot_icon:
-            screen.blit(self.boot_icon, (icon_x, bg_rect.top + y_offset + 60))
-        speed_text = stats_font.render(f"{self.player.speed:.1f}", True, (255, 255, 255))
-        screen.blit(speed_text, (text_x, bg_rect.top + y_offset + 60))
+        if self.player:
+            self.stats_panel.set_stats(self.player.hp, self.player.damage, self.player.speed)
 
     def check_door_collision(self, player_rect):
         room = self.current_room.physical_room
-        if any(enemy.alive for enemy in room.enemies):
+        if room.is_locked:
             return None  
     
         check_rect = player_rect.inflate(2, 2) 
@@ -260,26 +433,3 @@ class Level:
             if check_rect.colliderect(door):
                 return direction
         return None
-
-    def check_projectile_collisions(self, projectiles, player):
-        for projectile in projectiles[:]: 
-            for enemy in self.current_room.physical_room.enemies[:]:
-                if enemy.alive and projectile.rect.colliderect(enemy.rect):
-                    new_enemies = enemy.take_damage(player.damage) 
-                    if new_enemies:  
-                        self.current_room.physical_room.enemies.extend(new_enemies)
-                    projectiles.remove(projectile)
-                    break
-
-    def check_item_collisions(self, player):
-        if not hasattr(self.current_room.physical_room, 'items'):
-            return
-            
-        for item in self.current_room.physical_room.items[:]:
-            effect = item.update(player.rect)
-            if effect:
-                if "win_game" in effect:
-                    return effect 
-                player.apply_item_effect(effect)
-                self.current_room.physical_room.items.remove(item)
-        return None
\ No newline at end of file
@@ -4,10 +4,17 @@ import pygame
 from config import *
 from enemy import *
 from item import *
+from flowfield import FlowField
+from ecs import World
+from projectile import ProjectilePool
+from particles import ParticleSystem
 
 class PhysicalRoom:
-    def __init__(self, room_type: str = "normal", width: int = WIDTH, height: int = HEIGHT):
+    def __init__(self, room_type: str = "normal", width: int = WIDTH, height: int = HEIGHT, floor: int = 1,
+                 rng: Optional[random.Random] = None):
         self.type = room_type
+        self.floor = floor
+        self.random = rng or random.Random()
         self.width = width
         self.height = height
         self.wall_thickness = WALL_THICKNESS
@@ -16,11 +23,17 @@ class PhysicalRoom:
         self.walls = []
         self.doors = []
         self._generate_layout()
-        self.enemies = []
+        self.flow_field = FlowField(self)
+        self.state = ROOM_CLEARED
+        self.live_enemies = 0
+        self.listeners = []
+        self.world = World(self)
+        self.enemy_shots = ProjectilePool(self)
+        self.particles = ParticleSystem()
         self.enemies_spawned = False
         self.spawn_enemies()
-        self.items = []
         self.items_spawned = False
+        self.background = None
 
     def _generate_layout(self):
         self.walls = [
@@ -30,6 +43,69 @@ class PhysicalRoom:
             pygame.Rect(self.width - self.wall_thickness, 0, self.wall_thickness, self.height)  
         ]
 
+        self.cols = -(-self.width // TILE_SIZE)
+        self.rows = -(-self.height // TILE_SIZE)
+        self.tiles = bytearray(self.cols * self.rows)
+        for wall in self.walls:
+            self._fill_tiles(wall, TILE_WALL)
+
+        if self.type == "normal":
+            self._place_obstacles()
+
+    def _fill_tiles(self, rect: pygame.Rect, tile: int):
+        for row in range(rect.top // TILE_SIZE, (rect.bottom - 1) // TILE_SIZE + 1):
+            for col in range(rect.left // TILE_SIZE, (rect.right - 1) // TILE_SIZE + 1):
+                self.tiles[row * self.cols + col] = tile
+
+    def _is_reserved_tile(self, col: int, row: int) -> bool:
+        center_col, center_row = self.cols // 2, self.rows // 2
+        return center_col - 2 <= col < center_col + 2 or center_row - 2 <= row < center_row + 2
+
+    def _place_obstacles(self):
+        for _ in range(self.random.randint(*OBSTACLE_CLUSTERS)):
+            tile = TILE_ROCK if self.random.random() < 0.7 else TILE_PIT
+            cluster_w = self.random.randint(1, OBSTACLE_CLUSTER_SIZE)
+            cluster_h = self.random.randint(1, OBSTACLE_CLUSTER_SIZE)
+            first_col = self.random.randint(3, self.cols - 3 - cluster_w)
+            first_row = self.random.randint(3, self.rows - 3 - cluster_h)
+
+            for row in range(first_row, first_row + cluster_h):
+                for col in range(first_col, first_col + cluster_w):
+                    if not self._is_reserved_tile(col, row):
+                        self.tiles[row * self.cols + col] = tile
+
+        self._fill_unreachable_tiles()
+
+    def _fill_unreachable_tiles(self):
+        start = (self.rows // 2) * self.cols + self.cols // 2
+        reached = bytearray(len(self.tiles))
+        reached[start] = 1
+        stack = [start]
+
+        while stack:
+            cell = stack.pop()
+            row, col = divmod(cell, self.cols)
+            for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
+                nx, ny = col + dx, row + dy
+                if 0 <= nx < self.cols and 0 <= ny < self.rows:
+                    neighbour = ny * self.cols + nx
+                    if not reached[neighbour] and not self.tiles[neighbour] & TILE_BLOCKS_MOVEMENT:
+                        reached[neighbour] = 1
+                        stack.append(neighbour)
+
+        for cell, tile in enumerate(self.tiles):
+            if tile == TILE_FLOOR and not reached[cell]:
+                self.tiles[cell] = TILE_ROCK
+
+    def random_floor_position(self, size: int = 50, margin: int = 100) -> Tuple[int, int]:
+        probe = pygame.Rect(0, 0, size, size)
+        for _ in range(50):
+            probe.center = (self.random.randint(margin, self.width - margin),
+                            self.random.randint(margin, self.height - margin))
+            if not self.check_collision(probe):
+                return probe.center
+        return self.width // 2, self.height // 2
+
     def add_door(self, direction: str): 
         door_pos = {
             "up": (
@@ -61,8 +137,52 @@ class PhysicalRoom:
         door_rect = pygame.Rect(*door_pos[direction])
         self.doors.append((direction, door_rect))
 
-    def check_collision(self, rect: pygame.Rect) -> bool:
-        return any(rect.colliderect(wall) for wall in self.walls)
+    def check_collision(self, rect: pygame.Rect, mask: int = TILE_BLOCKS_MOVEMENT) -> bool:
+        if rect.left < 0 or rect.top < 0 or rect.right > self.width or rect.bottom > self.height:
+            return True
+
+        tiles = self.tiles
+        first_col = rect.left // TILE_SIZE
+        last_col = (rect.right - 1) // TILE_SIZE + 1
+        for row in range(rect.top // TILE_SIZE, (rect.bottom - 1) // TILE_SIZE + 1):
+            base = row * self.cols
+            for tile in tiles[base + first_col:base + last_col]:
+                if tile & mask:
+                    return True
+        return False
+
+    @property
+    def is_locked(self) -> bool:
+        return self.state == ROOM_LOCKED
+
+    def subscribe(self, listener):
+        self.listeners.append(listener)
+
+    def _notify(self, event: str, data=None):
+        for listener in self.listeners:
+            listener(self, event, data)
+
+    def _update_state(self):
+        state = ROOM_LOCKED if self.live_enemies > 0 else ROOM_CLEARED
+        if state != self.state:
+            self.state = state
+            self._notify("state_changed", state)
+
+    def add_enemy(self, eid):
+        self.live_enemies += 1
+        self._notify("enemy_added", eid)
+        self._update_state()
+
+    def remove_enemy(self, eid):
+        self.live_enemies -= 1
+        self._notify("enemy_killed", eid)
+        self._update_state()
+
+    def clear_enemies(self):
+        for eid in list(self.world.enemy.ids) + list(self.world.follow.ids):
+            self.world.destroy(eid)
+        self.world.flush()
+        self.enemies_spawned = False
 
     def spawn_enemies(self):
         if self.enemies_spawned or self.type in ["start", "treasure"]:
@@ -71,17 +191,13 @@ class PhysicalRoom:
         self.enemies_spawned = True
 
         if self.type == "boss":
-            boss = Dupok(self.width // 2, self.height // 2)
-            self.enemies.append(boss)
+            spawn_enemy(self.world, "dupok_large", self.width // 2, self.height // 2)
         else:
-            enemy_count = random.randint(1, 4)
+            enemy_count = self.random.randint(1, 4) + (self.floor - 1) * FLOOR_EXTRA_ENEMIES
             for _ in range(enemy_count):
-                x = random.randint(100, self.width - 100)
-                y = random.randint(100, self.height - 100)
-                if random.random() < 0.5:
-                    self.enemies.append(WalkingEnemy(x, y))
-                else:
-                    self.enemies.append(ShooterEnemy(x, y))
+                x, y = self.random_floor_position()
+                enemy_type = "walker" if self.random.random() < 0.5 else "shooter"
+                spawn_enemy(self.world, enemy_type, x, y)
 
     def spawn_items(self):
         if self.items_spawned:
@@ -90,20 +206,18 @@ class PhysicalRoom:
         self.items_spawned = True
     
         if self.type == "treasure":
-            item_types = [HealthUpItem, SpeedUpItem, DamageUpItem, Upgrade]
-            for _ in range(random.randint(1, 1)):
-                x = random.randint(100, self.width - 100)
-                y = random.randint(100, self.height - 100)
-                item_class = random.choice(item_types)
-                self.items.append(item_class(x, y))
+            for _ in range(self.random.randint(1, 1)):
+                x, y = self.random_floor_position()
+                spawn_item(self.world, self.random.choice(TREASURE_ITEMS), x - 25, y - 25)
 
 
 class Room:
-    def __init__(self, room_type: str = "normal", position: Tuple[int, int] = (0, 0)):
+    def __init__(self, room_type: str = "normal", position: Tuple[int, int] = (0, 0), floor: int = 1,
+                 rng: Optional[random.Random] = None):
         self.type = room_type
         self.position = position
         self.connections = {"up": None, "down": None, "left": None, "right": None}
-        self.physical_room = PhysicalRoom(room_type) 
+        self.physical_room = PhysicalRoom(room_type, floor=floor, rng=rng)
 
     def add_connection(self, direction: str, other_room):
         self.connections[direction] = other_room
@@ -111,9 +225,11 @@ class Room:
 
 
 class LevelGenerator:
-    def __init__(self, width: int = 7, height: int = 7):
+    def __init__(self, width: int = 7, height: int = 7, floor: int = 1, seed: Optional[int] = None):
         self.width = max(5, width)
         self.height = max(5, height)
+        self.floor = floor
+        self.random = random.Random(seed)
         self.grid: List[List[Optional[Room]]] = [[None for _ in range(width)] for _ in range(height)]
         self.start_pos = (width // 2, height // 2)
 
@@ -144,11 +260,10 @@ class LevelGenerator:
         return self.grid
 
     def _create_room(self, x: int, y: int, room_type: str):
-        room = Room(room_type, (x, y))
+        room = Room(room_type, (x, y), self.floor, self.random)
         self.grid[y][x] = room
         if room_type in ["start", "treasure", "boss"]:
-            room.physical_room.enemies = []
-            room.physical_room.enemies_spawned = False
+            room.physical_room.clear_enemies()
             room.physical_room.spawn_enemies()
         return room
 
@@ -172,7 +287,7 @@ class LevelGenerator:
                 else:
                     return self._generate_main_path(start_x, start_y)
 
-            dx, dy = random.choice(directions)
+            dx, dy = self.random.choice(directions)
             next_x, next_y = current_x + dx, current_y + dy
 
             if self.grid[next_y][next_x] is None:
@@ -191,23 +306,23 @@ class LevelGenerator:
 
     def _add_treasure_room(self, main_path: List[Tuple[int, int]]):
         if len(main_path) > 2:
-            x, y = random.choice(main_path[1:-1])
+            x, y = self.random.choice(main_path[1:-1])
             room = self.grid[y][x]
             room.type = "treasure"
             room.physical_room.type = "treasure"
-            room.physical_room.enemies = []
+            room.physical_room.clear_enemies()
             room.physical_room.spawn_items()
 
     def _fill_with_connected_rooms(self, main_path: List[Tuple[int, int]]):
         for x, y in main_path:
             for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
                 nx, ny = x + dx, y + dy
-                if (self._is_valid_position(nx, ny) and self.grid[ny][nx] is None and random.random() < 0.7):
+                if (self._is_valid_position(nx, ny) and self.grid[ny][nx] is None and self.random.random() < 0.7):
                     self._create_and_connect_room(nx, ny, x, y)
 
         for y in range(self.height):
             for x in range(self.width):
-                if self.grid[y][x] is None and random.random() < 0.4:
+                if self.grid[y][x] is None and self.random.random() < 0.4:
                     self._create_and_connect_to_nearest(x, y)
     
     def _create_and_connect_room(self, x: int, y: int, connected_x: int, connected_y: int):
@@ -1,10 +1,13 @@
 import pygame
 from menu import main_menu
 from config import HEIGHT, WIDTH
+from assets import asset_store
+from gamelog import log
 
 def main():
     pygame.init()
     pygame.mixer.init()
+    asset_store.start()
 
     screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
     pygame.display.set_caption("The Binding of Vacuum Cleaner: Recleaning")
@@ -14,7 +17,7 @@ def main():
         pygame.mixer.music.set_volume(0.5)
         pygame.mixer.music.play(-1)  
     except Exception as e:
-        print(f"Could not load menu music: {e}")
+        log.warning("audio", "Could not load menu music: %s", e)
 
     main_menu(screen)
 
@@ -0,0 +1,107 @@
+import os
+import sys
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from config import *
+
+def value_bytes(value):
+    if isinstance(value, float):
+        return sys.getsizeof(value)
+    if isinstance(value, int) and not -5 <= value <= 256:
+        return sys.getsizeof(value)
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(value_bytes(item) for item in value)
+    return 0
+
+def sprite_bytes(sprite):
+    return sys.getsizeof(sprite) + sys.getsizeof(sprite.__dict__) + sys.getsizeof(sprite.rect)
+
+def entity_type(world, eid):
+    if eid in world.enemy:
+        return world.enemy.get(eid, "type_name")
+    if eid in world.pickup:
+        return f"item:{world.pickup.get(eid, 'type_name')}"
+    if eid in world.lifetime:
+        return "player_shot"
+    if eid in world.follow:
+        return "glow"
+    return "other"
+
+def entity_bytes(world, eid):
+    total = 0
+    for store in world.stores:
+        if eid not in store:
+            continue
+        slot = store.index[eid]
+        total += 8 * (len(store.columns) + 1)
+        total += sys.getsizeof(store.index) // max(1, len(store.index))
+        for column in store.columns:
+            value = column[slot]
+            total += sprite_bytes(value) if store is world.sprite else value_bytes(value)
+    return total
+
+def pool_bytes(pool):
+    total = sum(column.nbytes for column in (pool.x, pool.y, pool.vx, pool.vy, pool.angle, pool.ttl, pool.homing))
+    return total + sys.getsizeof(pool.pending) + sum(value_bytes(shot) for shot in pool.pending)
+
+def room_bytes(room):
+    flow_field = room.flow_field
+    return (sys.getsizeof(room.tiles) + sys.getsizeof(flow_field.blocked)
+            + sys.getsizeof(flow_field.flow_x) + sys.getsizeof(flow_field.flow_y))
+
+def report(rooms):
+    counts = {}
+    sizes = {}
+    room_total = 0
+    for row in rooms:
+        for room in row:
+            if room is None:
+                continue
+            world = room.physical_room.world
+            room_total += room_bytes(room.physical_room)
+            shots = room.physical_room.enemy_shots
+            if len(shots):
+                counts["enemy_shot"] = counts.get("enemy_shot", 0) + len(shots)
+                sizes["enemy_shot"] = sizes.get("enemy_shot", 0) + pool_bytes(shots)
+            for eid in world.transform.ids:
+                name = entity_type(world, eid)
+                counts[name] = counts.get(name, 0) + 1
+                sizes[name] = sizes.get(name, 0) + entity_bytes(world, eid)
+    return counts, sizes, room_total
+
+def main():
+    seed = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    shots = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+    random.seed(seed)
+
+    pygame.display.set_mode((WIDTH, HEIGHT))
+
+    from levelgenerator import LevelGenerator
+    from atlas import sprite_atlas
+
+    generator = LevelGenerator(seed=seed)
+    rooms = generator.generate()
+    for row in rooms:
+        for room in row:
+            if room and room.type == "boss":
+                for _ in range(shots):
+                    angle = random.uniform(0, 360)
+                    room.physical_room.enemy_shots.emit(room.physical_room.width // 2,
+                                                        room.physical_room.height // 2, 0, 1, angle)
+
+    counts, sizes, room_total = report(rooms)
+    print(f"{'entity type':<20}{'count':>8}{'bytes':>12}{'bytes/entity':>14}")
+    for name in sorted(counts):
+        print(f"{name:<20}{counts[name]:>8}{sizes[name]:>12}{sizes[name] // counts[name]:>14}")
+    print(f"{'total':<20}{sum(counts.values()):>8}{sum(sizes.values()):>12}")
+    print(f"room grids and flow fields: {room_total} bytes")
+    atlas_bytes = sum(sheet.get_width() * sheet.get_height() * sheet.get_bytesize() for sheet in sprite_atlas.sheets)
+    print(f"atlas: {len(sprite_atlas.sheets)} sheets, {len(sprite_atlas.regions)} regions, {atlas_bytes} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,10 +3,11 @@ import sys
 from button import Button
 from realisation import show_info, show_records, start_game
 from config import *
+from assets import asset_store
+from soundbank import sound_bank
+from gamelog import log
 
 def main_menu(screen):
-    clock = pygame.time.Clock()
-    
     buttons = [
         Button("New Game"),
         Button("Run Records"),
@@ -24,11 +25,32 @@ def main_menu(screen):
             button.update_position(x, y)
 
     update_buttons()
+    title = font_medium.render("The Binding of Vacuum Cleaner: Recleaning", True, RED)
+    redraw = True
 
     while True:
-        mouse_pos = pygame.mouse.get_pos()
-        
-        for event in pygame.event.get():
+        if redraw:
+            screen.fill(BLACK)
+            screen.blit(title, title.get_rect(center=(screen.get_width() // 2, 100)))
+
+            for button in buttons:
+                button.draw(screen)
+
+            if not sound_bank.loaded:
+                if asset_store.is_done():
+                    sound_bank.load()
+                else:
+                    draw_loading_bar(screen, asset_store.progress())
+
+            pygame.display.flip()
+            redraw = False
+
+        timeout = 0 if sound_bank.loaded else LOADING_REFRESH_INTERVAL
+        events = [pygame.event.wait(timeout)] + pygame.event.get()
+        if not sound_bank.loaded:
+            redraw = True
+
+        for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -36,6 +58,16 @@ def main_menu(screen):
             if event.type == pygame.VIDEORESIZE:
                 screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
                 update_buttons()
+                redraw = True
+
+            if event.type == pygame.WINDOWEXPOSED:
+                redraw = True
+
+            if event.type == pygame.MOUSEMOTION:
+                for button in buttons:
+                    was_hovered = button.is_hovered
+                    if button.check_hover(event.pos) != was_hovered:
+                        redraw = True
             
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:
@@ -43,11 +75,13 @@ def main_menu(screen):
                         if button.is_hovered:
                             if i == 0:
                                 if start_game(screen):
+                                    screen = pygame.display.get_surface()
+                                    update_buttons()
                                     try:
                                         pygame.mixer.music.load(MUSIC_MENU)
                                         pygame.mixer.music.play(-1)
                                     except:
-                                        print("Could not load menu music")
+                                        log.warning("audio", "Could not load menu music")
                             elif i == 1:
                                 show_records(screen)
                             elif i == 2:
@@ -55,17 +89,19 @@ def main_menu(screen):
                             elif i == 3:
                                 pygame.quit()
                                 sys.exit()
-        
-        screen.fill(BLACK)
-        
-        title = font_medium.render("The Binding of Vacuum Cleaner: Recleaning", True, RED)
-        title_rect = title.get_rect(center=(screen.get_width() // 2, 100))
-        screen.blit(title, title_rect)
-        
-        for button in buttons:
-            button.check_hover(mouse_pos)
-            button.draw(screen)
-        
-        pygame.display.flip()
-        clock.tick(60)
 
+                            mouse_pos = pygame.mouse.get_pos()
+                            for other in buttons:
+                                other.check_hover(mouse_pos)
+                            redraw = True
+                            break
+
+def draw_loading_bar(screen, progress):
+    bar_width, bar_height = 300, 12
+    bar_x = (screen.get_width() - bar_width) // 2
+    bar_y = screen.get_height() - 60
+    pygame.draw.rect(screen, GRAY, (bar_x, bar_y, bar_width, bar_height), 1)
+    pygame.draw.rect(screen, WHITE, (bar_x, bar_y, int(bar_width * progress), bar_height))
+
+    text = font_medium.render(f"Loading {int(progress * 100)}%", True, WHITE)
+    screen.blit(text, text.get_rect(center=(screen.get_width() // 2, bar_y - 20)))
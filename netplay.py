@@ -0,0 +1,761 @@
+import os
+import sys
+import time
+import random
+import struct
+import asyncio
+import multiprocessing
+from collections import deque
+import numpy as np
+import pygame
+from config import *
+from gamelog import log
+
+MSG_WELCOME = 0
+MSG_ROOM = 1
+MSG_SNAPSHOT = 2
+MSG_END = 3
+MSG_INPUT = 4
+
+INPUT_KEYS = [pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d, pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT]
+DOOR_DIRECTIONS = ["up", "down", "left", "right"]
+OUTCOMES = ["win", "death", "abandoned"]
+
+FIELD_KIND = 1
+FIELD_X = 2
+FIELD_Y = 4
+FIELD_ANGLE = 8
+FIELD_NUDGE = 16
+
+SNAPSHOT_FULL = 1
+SNAPSHOT_LOCKED = 2
+
+PLAYER_DEAD = 1
+PLAYER_VISIBLE = 2
+
+SNAPSHOT_HEADER = struct.Struct("<IIHBBH")
+PLAYER_RECORD = struct.Struct("<HHBBbBB")
+SHOT_RECORD = np.dtype([("x", "<u2"), ("y", "<u2"), ("angle", "u1")])
+
+class InputState:
+    def __init__(self, bits=0):
+        self.bits = bits
+
+    def __getitem__(self, key):
+        if key not in INPUT_KEYS:
+            return False
+        return bool(self.bits >> INPUT_KEYS.index(key) & 1)
+
+def input_bits(keys):
+    return sum(1 << i for i, key in enumerate(INPUT_KEYS) if keys[key])
+
+def quantize(value):
+    return min(max(int(round(value * NET_POSITION_SCALE)), 0), 0xFFFF)
+
+def quantize_angle(angle):
+    return int(round(angle % 360 * 256 / 360)) & 0xFF
+
+def pack_rect(rect):
+    return struct.pack("<HHHH", rect.x, rect.y, rect.width, rect.height)
+
+def visual_regions():
+    from enemy import ENEMY_TYPES, load_frames, get_glow_image
+    from item import ITEM_TYPES, load_item_texture
+    from projectile import rotated_textures
+
+    regions = []
+    for data in ENEMY_TYPES.values():
+        layers = [LAYER_ENEMIES] * len(data["frames"])
+        regions.extend(zip(load_frames(data["frames"], data["size"]), layers))
+        if data.get("glow"):
+            regions.append((get_glow_image(int(data["size"] * 0.6)), LAYER_ENEMIES))
+    for data in ITEM_TYPES.values():
+        regions.append((load_item_texture(data["texture"]), LAYER_FLOOR_ITEMS))
+    regions.extend((region, LAYER_PROJECTILES) for region in rotated_textures())
+    return regions
+
+def player_poses():
+    from player import Player
+    from atlas import sprite_atlas
+
+    player = Player(0, 0)
+    poses = []
+    for base in (player.original_image, player.upgraded_image):
+        poses.append(base)
+        poses.append(sprite_atlas.flipped(base, True, False))
+        poses.extend(sprite_atlas.rotated(base, angle) for angle in (0, 180, 90, -90))
+    poses.append(player.death_image)
+    return poses
+
+async def send_message(writer, tag, payload=b""):
+    writer.write(struct.pack("<HB", len(payload) + 1, tag) + payload)
+    await writer.drain()
+    return len(payload) + 3
+
+async def receive_message(reader):
+    size, = struct.unpack("<H", await reader.readexactly(2))
+    data = await reader.readexactly(size)
+    return data[0], data[1:]
+
+
+class NetStats:
+    def __init__(self, players=NET_PLAYERS):
+        self.players = players
+        self.tick_times = deque(maxlen=int(NET_TICK_RATE * NET_STATS_INTERVAL))
+        self.snapshot_sizes = deque(maxlen=int(NET_SNAPSHOT_RATE * NET_STATS_INTERVAL))
+        self.entity_counts = deque(maxlen=int(NET_SNAPSHOT_RATE * NET_STATS_INTERVAL))
+        self.bytes_sent = 0
+        self.shots_trimmed = 0
+        self.started = time.perf_counter()
+
+    def start(self):
+        self.bytes_sent = 0
+        self.started = time.perf_counter()
+
+    def tick_time(self):
+        return sum(self.tick_times) / len(self.tick_times) if self.tick_times else 0.0
+
+    def summary(self):
+        elapsed = max(time.perf_counter() - self.started, 1e-6)
+        sizes = self.snapshot_sizes or [0]
+        return {
+            "tick_ms": self.tick_time() * 1000,
+            "tick_max_ms": max(self.tick_times, default=0.0) * 1000,
+            "snapshot_bytes": sum(sizes) / len(sizes),
+            "snapshot_max_bytes": max(sizes),
+            "entities": sum(self.entity_counts) / len(self.entity_counts) if self.entity_counts else 0,
+            "kbps_per_client": self.bytes_sent / elapsed / 1024 / self.players,
+            "shots_trimmed": self.shots_trimmed,
+        }
+
+
+class GameServer:
+    def __init__(self, host=NET_HOST, port=NET_PORT, players=NET_PLAYERS):
+        self.host = host
+        self.port = port
+        self.player_count = players
+        self.writers = []
+        self.handlers = []
+        self.inputs = [0] * players
+        self.ready = None
+        self.server = None
+        self.running = True
+        self.outcome = None
+        self.stats = NetStats(players)
+        self.level = None
+        self.players = []
+        self.baseline = {}
+        self.sent_room = None
+        self.sent_floor = None
+        self.seq = 0
+        self.tick_count = 0
+
+    async def handle_client(self, reader, writer):
+        if len(self.writers) >= self.player_count or self.ready.is_set():
+            writer.close()
+            return
+        index = len(self.writers)
+        self.writers.append(writer)
+        self.handlers.append(asyncio.current_task())
+        log.info("net", "Player %d connected", index + 1)
+        await send_message(writer, MSG_WELCOME, struct.pack("<BB", index, self.player_count))
+        if len(self.writers) == self.player_count:
+            self.ready.set()
+
+        try:
+            while self.running:
+                tag, payload = await receive_message(reader)
+                if tag == MSG_INPUT:
+                    self.inputs[index], = struct.unpack("<H", payload)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            if self.running:
+                log.info("net", "Player %d disconnected", index + 1)
+                self.outcome = self.outcome or "abandoned"
+
+    def setup(self):
+        from levelgenerator import LevelGenerator
+        from level import Level
+        from player import Player
+
+        generator = LevelGenerator()
+        generator.generate()
+        self.level = Level(generator)
+        self.players = [Player(WIDTH // 2 + (i - (self.player_count - 1) / 2) * 60, HEIGHT // 2)
+                        for i in range(self.player_count)]
+        self.level.set_player(self.players[0])
+        for player in self.players[1:]:
+            self.level.add_player(player)
+        self.level.prepare_next_floor()
+
+        self.kinds = {}
+        for kind, (region, _) in enumerate(visual_regions()):
+            self.kinds.setdefault(region, kind)
+        self.poses = {region: pose for pose, region in enumerate(player_poses())}
+        self.started_at = pygame.time.get_ticks()
+
+    async def listen(self):
+        self.ready = asyncio.Event()
+        self.server = await asyncio.start_server(self.handle_client, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        log.info("net", "Server listening on %s:%d", self.host, self.port)
+
+    async def run(self):
+        if self.ready is None:
+            await self.listen()
+        await self.ready.wait()
+        self.setup()
+        self.stats.start()
+
+        loop = asyncio.get_running_loop()
+        interval = 1 / NET_TICK_RATE
+        snapshot_every = max(1, NET_TICK_RATE // NET_SNAPSHOT_RATE)
+        next_tick = loop.time()
+        next_report = time.perf_counter() + NET_STATS_INTERVAL
+
+        while self.outcome is None:
+            started = time.perf_counter()
+            self.tick(interval * 1000)
+            self.stats.tick_times.append(time.perf_counter() - started)
+            self.tick_count += 1
+
+            if self.tick_count % snapshot_every == 0 or self.outcome:
+                await self.broadcast()
+
+            if time.perf_counter() >= next_report:
+                next_report += NET_STATS_INTERVAL
+                summary = self.stats.summary()
+                log.info("net", "tick %.2f ms (max %.2f), snapshot %.0f B (max %d), %.1f KB/s per client, %.0f entities",
+                         summary["tick_ms"], summary["tick_max_ms"], summary["snapshot_bytes"],
+                         summary["snapshot_max_bytes"], summary["kbps_per_client"], summary["entities"])
+
+            next_tick += interval
+            delay = next_tick - loop.time()
+            if delay < -0.25:
+                next_tick = loop.time()
+            await asyncio.sleep(max(0.0, delay))
+
+        elapsed = (pygame.time.get_ticks() - self.started_at) // 1000
+        for writer in self.writers:
+            try:
+                await send_message(writer, MSG_END, struct.pack("<BH", OUTCOMES.index(self.outcome), elapsed))
+            except ConnectionError:
+                pass
+        self.running = False
+        for writer in self.writers:
+            writer.close()
+        await asyncio.gather(*self.handlers, return_exceptions=True)
+        self.server.close()
+        return self.outcome
+
+    def tick(self, dt):
+        level = self.level
+        for player, bits in zip(self.players, self.inputs):
+            if player.dead:
+                continue
+            keys = InputState(bits)
+            player.handle_movement(keys, level)
+            direction = level.check_door_collision(player.rect)
+            if direction:
+                level.change_room(direction, player)
+            player.handle_shooting(keys, level)
+            player.update_shooting()
+
+        alive = [player for player in self.players if not player.dead]
+        effect = level.update(self.players[0], dt)
+        if effect and "win_game" in effect:
+            if level.is_last_floor():
+                self.outcome = "win"
+            else:
+                level.advance_floor()
+
+        for player in self.players:
+            player.unlock_movement()
+            player.update_invincibility()
+        if not alive:
+            self.outcome = "death"
+
+    def room_message(self):
+        room = self.level.current_room.physical_room
+        room_type = room.type.encode()
+        payload = [struct.pack("<BBHHHB", self.level.floor, room.is_locked, room.width, room.height,
+                               room.cols, len(room_type)), room_type]
+        payload.append(struct.pack("<B", len(room.walls)))
+        payload.extend(pack_rect(wall) for wall in room.walls)
+        payload.append(struct.pack("<B", len(room.doors)))
+        for direction, door in room.doors:
+            payload.append(struct.pack("<B", DOOR_DIRECTIONS.index(direction)) + pack_rect(door))
+        payload.append(struct.pack("<H", len(room.tiles)) + bytes(room.tiles))
+        return b"".join(payload)
+
+    def capture(self):
+        world = self.level.current_room.physical_room.world
+        transform = world.transform
+        rotation = world.rotation
+        entities = {}
+        for eid, sprite in zip(world.sprite.ids, world.sprite.sprite):
+            region, angle = sprite.region, 0
+            if eid in rotation:
+                region = rotation.get(eid, "base_image")
+                angle = quantize_angle(rotation.get(eid, "angle"))
+            kind = self.kinds.get(region)
+            if kind is None:
+                continue
+            entities[eid] = (kind, quantize(transform.get(eid, "x")), quantize(transform.get(eid, "y")), angle)
+        return entities
+
+    def encode_snapshot(self, full):
+        level = self.level
+        room = level.current_room.physical_room
+        entities = self.capture()
+        baseline = {} if full else self.baseline
+        self.baseline = entities
+
+        flags = (SNAPSHOT_FULL if full else 0) | (SNAPSHOT_LOCKED if room.is_locked else 0)
+        elapsed = (pygame.time.get_ticks() - self.started_at) // 1000
+        tick_time = min(int(self.stats.tick_time() * 100000), 0xFFFF)
+        payload = [SNAPSHOT_HEADER.pack(self.seq, self.tick_count, elapsed, flags, level.floor, tick_time)]
+
+        for player in self.players:
+            player_flags = (PLAYER_DEAD if player.dead else 0) | (PLAYER_VISIBLE if player.visible else 0)
+            payload.append(PLAYER_RECORD.pack(quantize(player.rect.centerx), quantize(player.rect.centery),
+                                              self.poses.get(player.region, 0), player_flags,
+                                              max(-128, min(127, player.hp)), min(player.damage, 255),
+                                              min(int(round(player.speed * 10)), 255)))
+
+        removed = [nid for nid in baseline if nid not in entities]
+        payload.append(struct.pack(f"<H{len(removed)}I", len(removed), *removed))
+
+        changed = []
+        for nid, record in entities.items():
+            old = baseline.get(nid)
+            if old == record:
+                continue
+            if old is None or old[0] != record[0]:
+                changed.append(struct.pack("<IBHHHB", nid, FIELD_KIND | FIELD_X | FIELD_Y | FIELD_ANGLE, *record))
+                continue
+            dx, dy = record[1] - old[1], record[2] - old[2]
+            mask, fields = 0, b""
+            if dx or dy:
+                if -128 <= dx < 128 and -128 <= dy < 128:
+                    mask |= FIELD_NUDGE
+                    fields += struct.pack("<bb", dx, dy)
+                else:
+                    mask |= FIELD_X | FIELD_Y
+                    fields += struct.pack("<HH", record[1], record[2])
+            if record[3] != old[3]:
+                mask |= FIELD_ANGLE
+                fields += struct.pack("<B", record[3])
+            changed.append(struct.pack("<IB", nid, mask) + fields)
+        payload.append(struct.pack("<H", len(changed)))
+        payload.extend(changed)
+
+        shots = room.enemy_shots
+        used = sum(len(part) for part in payload) + 2
+        limit = max(0, (NET_SNAPSHOT_BUDGET - used) // SHOT_RECORD.itemsize)
+        count = min(len(shots.x), limit)
+        self.stats.shots_trimmed += len(shots.x) - count
+        records = np.empty(count, dtype=SHOT_RECORD)
+        records["x"] = np.clip(np.rint(shots.x[:count] * NET_POSITION_SCALE), 0, 0xFFFF)
+        records["y"] = np.clip(np.rint(shots.y[:count] * NET_POSITION_SCALE), 0, 0xFFFF)
+        records["angle"] = np.rint(shots.angle[:count] % 360 * 256 / 360).astype(np.intp) & 0xFF
+        payload.append(struct.pack("<H", count) + records.tobytes())
+
+        self.stats.entity_counts.append(len(entities) + len(self.players) + count)
+        self.seq += 1
+        return b"".join(payload)
+
+    async def broadcast(self):
+        messages = []
+        room = self.level.current_room
+        if room is not self.sent_room or self.level.floor != self.sent_floor:
+            self.sent_room = room
+            self.sent_floor = self.level.floor
+            messages.append((MSG_ROOM, self.room_message()))
+            snapshot = self.encode_snapshot(True)
+        else:
+            snapshot = self.encode_snapshot(False)
+        messages.append((MSG_SNAPSHOT, snapshot))
+        self.stats.snapshot_sizes.append(len(snapshot) + 3)
+
+        for writer in self.writers:
+            for tag, payload in messages:
+                try:
+                    self.stats.bytes_sent += await send_message(writer, tag, payload)
+                except ConnectionError:
+                    self.outcome = self.outcome or "abandoned"
+
+
+class Snapshot:
+    def __init__(self, tick, elapsed, flags, floor, tick_time, players, entities, shots):
+        self.tick = tick
+        self.time = tick / NET_TICK_RATE
+        self.elapsed = elapsed
+        self.locked = bool(flags & SNAPSHOT_LOCKED)
+        self.floor = floor
+        self.tick_time = tick_time / 100
+        self.players = players
+        self.entities = entities
+        self.shots = shots
+
+
+class SnapshotDecoder:
+    def __init__(self, player_count=NET_PLAYERS):
+        self.player_count = player_count
+        self.entities = {}
+
+    def decode(self, payload):
+        seq, tick, elapsed, flags, floor, tick_time = SNAPSHOT_HEADER.unpack_from(payload)
+        offset = SNAPSHOT_HEADER.size
+        if flags & SNAPSHOT_FULL:
+            self.entities = {}
+        entities = dict(self.entities)
+
+        players = []
+        for _ in range(self.player_count):
+            players.append(PLAYER_RECORD.unpack_from(payload, offset))
+            offset += PLAYER_RECORD.size
+
+        count, = struct.unpack_from("<H", payload, offset)
+        offset += 2
+        for nid in struct.unpack_from(f"<{count}I", payload, offset):
+            entities.pop(nid, None)
+        offset += 4 * count
+
+        count, = struct.unpack_from("<H", payload, offset)
+        offset += 2
+        for _ in range(count):
+            nid, mask = struct.unpack_from("<IB", payload, offset)
+            offset += 5
+            kind, x, y, angle = entities.get(nid, (0, 0, 0, 0))
+            if mask & FIELD_KIND:
+                kind, = struct.unpack_from("<H", payload, offset)
+                offset += 2
+            if mask & FIELD_X:
+                x, = struct.unpack_from("<H", payload, offset)
+                offset += 2
+            if mask & FIELD_Y:
+                y, = struct.unpack_from("<H", payload, offset)
+                offset += 2
+            if mask & FIELD_NUDGE:
+                dx, dy = struct.unpack_from("<bb", payload, offset)
+                x, y = x + dx, y + dy
+                offset += 2
+            if mask & FIELD_ANGLE:
+                angle, = struct.unpack_from("<B", payload, offset)
+                offset += 1
+            entities[nid] = (kind, x, y, angle)
+
+        count, = struct.unpack_from("<H", payload, offset)
+        offset += 2
+        shots = np.frombuffer(payload, dtype=SHOT_RECORD, count=count, offset=offset)
+
+        self.entities = entities
+        return Snapshot(tick, elapsed, flags, floor, tick_time, players, entities, shots)
+
+
+class RoomView:
+    def __init__(self, payload):
+        floor, locked, self.width, self.height, self.cols, name_length = struct.unpack_from("<BBHHHB", payload)
+        offset = struct.calcsize("<BBHHHB")
+        self.floor = floor
+        self.is_locked = bool(locked)
+        self.type = payload[offset:offset + name_length].decode()
+        offset += name_length
+
+        self.walls = []
+        count = payload[offset]
+        offset += 1
+        for _ in range(count):
+            self.walls.append(pygame.Rect(struct.unpack_from("<HHHH", payload, offset)))
+            offset += 8
+
+        self.doors = []
+        count = payload[offset]
+        offset += 1
+        for _ in range(count):
+            direction = DOOR_DIRECTIONS[payload[offset]]
+            self.doors.append((direction, pygame.Rect(struct.unpack_from("<HHHH", payload, offset + 1))))
+            offset += 9
+
+        size, = struct.unpack_from("<H", payload, offset)
+        self.tiles = bytearray(payload[offset + 2:offset + 2 + size])
+
+
+class NetClient:
+    def __init__(self, screen, host=NET_HOST, port=NET_PORT):
+        self.screen = screen
+        self.host = host
+        self.port = port
+        self.index = 0
+        self.decoder = None
+        self.room = None
+        self.background = None
+        self.history = deque(maxlen=32)
+        self.clock_offset = None
+        self.outcome = None
+        self.elapsed = 0
+        self.bytes_received = 0
+        self.received_since = time.perf_counter()
+        self.bandwidth = 0.0
+
+    def load_visuals(self):
+        from level import HudLabel, load_room_painter, load_stats_panel
+        from rendergroup import RenderGroup
+        from projectile import rotated_textures
+        from atlas import sprite_atlas
+
+        self.visuals = visual_regions()
+        self.rotations = sprite_atlas.rotations
+        self.shot_regions = rotated_textures()
+        self.poses = player_poses()
+        self.painter = load_room_painter()
+        self.room_label = HudLabel(24, topleft=(20, 20))
+        self.timer_label = HudLabel(36, center=(int(WIDTH // 1.5), 30))
+        self.net_label = HudLabel(20, bottomleft=(20, HEIGHT - 10))
+        self.stats_panel = load_stats_panel()
+        self.hud = RenderGroup(self.room_label, self.timer_label, self.net_label, self.stats_panel)
+
+    async def receive(self, reader):
+        try:
+            while self.outcome is None:
+                tag, payload = await receive_message(reader)
+                self.bytes_received += len(payload) + 3
+                if tag == MSG_WELCOME:
+                    self.index, player_count = struct.unpack("<BB", payload)
+                    self.decoder = SnapshotDecoder(player_count)
+                elif tag == MSG_ROOM:
+                    self.room = RoomView(payload)
+                    self.background = None
+                    self.history.clear()
+                elif tag == MSG_SNAPSHOT:
+                    snapshot = self.decoder.decode(payload)
+                    offset = time.perf_counter() - snapshot.time
+                    if self.clock_offset is None or offset < self.clock_offset:
+                        self.clock_offset = offset
+                    self.history.append(snapshot)
+                elif tag == MSG_END:
+                    outcome, self.elapsed = struct.unpack("<BH", payload)
+                    self.outcome = OUTCOMES[outcome]
+        except (asyncio.IncompleteReadError, ConnectionError):
+            self.outcome = self.outcome or "abandoned"
+
+    def interpolated(self):
+        render_time = time.perf_counter() - self.clock_offset - NET_INTERPOLATION_DELAY
+        older = newer = self.history[-1]
+        for snapshot in reversed(self.history):
+            if snapshot.time <= render_time:
+                older = snapshot
+                break
+            newer = snapshot
+        if newer is older:
+            return older, newer, 0.0
+        return older, newer, (render_time - older.time) / (newer.time - older.time)
+
+    def draw(self):
+        screen = self.screen
+        screen.fill(BLACK)
+        if self.room is None or not self.history:
+            text = font_medium.render("Waiting for the other player...", True, WHITE)
+            screen.blit(text, text.get_rect(center=(WIDTH // 2, HEIGHT // 2)))
+            return
+
+        older, newer, blend = self.interpolated()
+        if self.background is None or self.room.is_locked != newer.locked:
+            self.room.is_locked = newer.locked
+            self.background = self.painter.render(self.room)
+        screen.blit(self.background, (0, 0))
+
+        sequence = []
+        for nid, (kind, x, y, angle) in sorted(newer.entities.items()):
+            previous = older.entities.get(nid)
+            if previous and previous[0] == kind:
+                x = previous[1] + (x - previous[1]) * blend
+                y = previous[2] + (y - previous[2]) * blend
+                turn = (angle - previous[3] + 128) % 256 - 128
+                angle = previous[3] + turn * blend
+            region, layer = self.visuals[kind]
+            center = (x / NET_POSITION_SCALE, y / NET_POSITION_SCALE)
+            if angle:
+                table = self.rotations(region)
+                region = table[round(angle * 360 / 256 / ROTATION_STEP) % len(table)]
+            rect = region.rect.copy()
+            rect.center = center
+            sequence.append((layer, region.sheet, rect, region.rect))
+
+        for x, y, angle in older.shots.tolist():
+            region = self.shot_regions[round(angle * 360 / 256) % 360]
+            rect = region.rect.copy()
+            rect.center = (x / NET_POSITION_SCALE, y / NET_POSITION_SCALE)
+            sequence.append((LAYER_PROJECTILES, region.sheet, rect, region.rect))
+
+        for (x, y, pose, flags, hp, damage, speed), previous in zip(newer.players, older.players):
+            if not flags & PLAYER_VISIBLE:
+                continue
+            x = previous[0] + (x - previous[0]) * blend
+            y = previous[1] + (y - previous[1]) * blend
+            region = self.poses[pose]
+            rect = region.rect.copy()
+            rect.center = (x / NET_POSITION_SCALE, y / NET_POSITION_SCALE)
+            sequence.append((LAYER_PLAYER, region.sheet, rect, region.rect))
+
+        sequence.sort(key=lambda item: item[0])
+        screen.blits([item[1:] for item in sequence], doreturn=False)
+
+        _, _, _, _, hp, damage, speed = newer.players[self.index]
+        self.room_label.set_text(f"Floor {newer.floor}  Room: {self.room.type}")
+        self.timer_label.set_text(f"{newer.elapsed // 60:02d}:{newer.elapsed % 60:02d}")
+        self.stats_panel.set_stats(hp, damage, speed / 10)
+        self.net_label.set_text(f"{self.bandwidth:.1f} KB/s  tick {newer.tick_time:.2f} ms  "
+                                f"{len(newer.entities) + len(newer.shots)} entities")
+        self.hud.draw(screen)
+
+    async def connect(self):
+        deadline = time.perf_counter() + 10
+        while True:
+            try:
+                return await asyncio.open_connection(self.host, self.port)
+            except OSError:
+                if time.perf_counter() > deadline:
+                    raise
+                await asyncio.sleep(0.2)
+
+    async def run(self):
+        from realisation import draw_death_screen, draw_win_screen, render_text
+
+        self.load_visuals()
+        reader, writer = await self.connect()
+        receiver = asyncio.create_task(self.receive(reader))
+        bits = None
+        leaving = False
+
+        while not leaving:
+            started = time.perf_counter()
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    leaving = True
+                if event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE or (self.outcome and event.key == pygame.K_SPACE):
+                        leaving = True
+
+            if self.outcome is None:
+                current = input_bits(pygame.key.get_pressed())
+                if current != bits:
+                    bits = current
+                    try:
+                        await send_message(writer, MSG_INPUT, struct.pack("<H", bits))
+                    except ConnectionError:
+                        self.outcome = "abandoned"
+
+            if started - self.received_since >= 1.0:
+                self.bandwidth = self.bytes_received / (started - self.received_since) / 1024
+                self.bytes_received = 0
+                self.received_since = started
+
+            self.draw()
+            if self.outcome == "win":
+                draw_win_screen(self.screen, self.elapsed)
+            elif self.outcome == "death":
+                draw_death_screen(self.screen, None)
+            elif self.outcome == "abandoned":
+                text = render_text(48, "Connection closed - press ESC", WHITE)
+                self.screen.blit(text, text.get_rect(center=(WIDTH // 2, HEIGHT // 2)))
+            pygame.display.flip()
+            await asyncio.sleep(max(0.0, 1 / 60 - (time.perf_counter() - started)))
+
+        receiver.cancel()
+        writer.close()
+        return self.outcome
+
+
+async def run_bot(host, port, seconds):
+    reader, writer = await asyncio.open_connection(host, port)
+    decoder = None
+    received = {"snapshots": 0, "bytes": 0, "entities": 0}
+
+    async def receive():
+        nonlocal decoder
+        try:
+            while True:
+                tag, payload = await receive_message(reader)
+                received["bytes"] += len(payload) + 3
+                if tag == MSG_WELCOME:
+                    decoder = SnapshotDecoder(payload[1])
+                elif tag == MSG_SNAPSHOT:
+                    snapshot = decoder.decode(payload)
+                    received["snapshots"] += 1
+                    received["entities"] = max(received["entities"], len(snapshot.entities) + len(snapshot.shots))
+                elif tag == MSG_END:
+                    return
+        except (asyncio.IncompleteReadError, ConnectionError):
+            return
+
+    receiver = asyncio.create_task(receive())
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline and not receiver.done():
+        movement = random.choice([0, 1, 2, 4, 8, 1 | 2, 4 | 8])
+        shooting = random.choice([0, 16, 32, 64, 128])
+        await send_message(writer, MSG_INPUT, struct.pack("<H", movement | shooting))
+        await asyncio.sleep(0.25)
+    writer.close()
+    await receiver
+    return received
+
+async def bench(seconds):
+    server = GameServer(port=0)
+    await server.listen()
+    game = asyncio.create_task(server.run())
+    bots = await asyncio.gather(*(run_bot(server.host, server.port, seconds) for _ in range(server.player_count)))
+    outcome = await game
+
+    summary = server.stats.summary()
+    print(f"outcome: {outcome}, {server.tick_count} ticks, {server.seq} snapshots")
+    print(f"tick time: {summary['tick_ms']:.2f} ms avg, {summary['tick_max_ms']:.2f} ms max")
+    print(f"snapshot: {summary['snapshot_bytes']:.0f} B avg, {summary['snapshot_max_bytes']} B max "
+          f"(budget {NET_SNAPSHOT_BUDGET} B), {summary['entities']:.0f} entities avg")
+    print(f"bandwidth: {summary['kbps_per_client']:.1f} KB/s per client, {summary['shots_trimmed']} shots trimmed")
+    for i, bot in enumerate(bots):
+        print(f"client {i + 1}: {bot['snapshots']} snapshots, {bot['bytes']} bytes, up to {bot['entities']} entities")
+
+def headless_display():
+    pygame.display.quit()
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    pygame.display.init()
+    pygame.display.set_mode((WIDTH, HEIGHT))
+
+def serve(host=NET_HOST, port=NET_PORT):
+    pygame.mixer.quit()
+    headless_display()
+    outcome = asyncio.run(GameServer(host, port).run())
+    log.info("net", "Game over: %s", outcome)
+
+def join(host=NET_HOST, port=NET_PORT):
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("The Binding of Vacuum Cleaner: Co-op")
+    return asyncio.run(NetClient(screen, host, port).run())
+
+def host(port=NET_PORT):
+    server = multiprocessing.get_context("spawn").Process(target=serve, args=(NET_HOST, port), daemon=True)
+    server.start()
+    try:
+        return join(NET_HOST, port)
+    finally:
+        server.terminate()
+
+def main():
+    mode = sys.argv[1] if len(sys.argv) > 1 else "host"
+    if mode == "host":
+        host(int(sys.argv[2]) if len(sys.argv) > 2 else NET_PORT)
+    elif mode == "join":
+        join(sys.argv[2] if len(sys.argv) > 2 else NET_HOST, int(sys.argv[3]) if len(sys.argv) > 3 else NET_PORT)
+    elif mode == "serve":
+        serve(NET_HOST, int(sys.argv[2]) if len(sys.argv) > 2 else NET_PORT)
+    elif mode == "bench":
+        pygame.mixer.quit()
+        headless_display()
+        asyncio.run(bench(float(sys.argv[2]) if len(sys.argv) > 2 else 10))
+    else:
+        print("usage: python netplay.py [host [port] | join [host] [port] | serve [port] | bench [seconds]]")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+import pygame
+import numpy as np
+from config import *
+from atlas import sprite_atlas
+
+EFFECT_NAMES = list(PARTICLE_EFFECTS)
+
+_frames = None
+_half_sizes = None
+
+def load_frames():
+    global _frames, _half_sizes
+    if _frames is None:
+        _frames = []
+        for name in EFFECT_NAMES:
+            effect = PARTICLE_EFFECTS[name]
+            for step in range(PARTICLE_FADE_STEPS):
+                fade = 1 - step / PARTICLE_FADE_STEPS
+                radius = max(1, round(effect["size"] * (0.5 + fade / 2)))
+                surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+                pygame.draw.circle(surf, (*effect["color"], int(255 * fade)), (radius, radius), radius)
+                region = sprite_atlas.add(("particle", name, step), surf)
+                _frames.append((region.sheet, region.rect))
+        _half_sizes = np.array([(rect.width // 2, rect.height // 2) for _, rect in _frames], dtype=np.intp)
+    return _frames
+
+class ParticleSystem:
+    def __init__(self, budget=PARTICLE_BUDGET):
+        self.budget = budget
+        self.x = np.zeros(0)
+        self.y = np.zeros(0)
+        self.vx = np.zeros(0)
+        self.vy = np.zeros(0)
+        self.age = np.zeros(0)
+        self.life = np.zeros(0)
+        self.kind = np.zeros(0, dtype=np.intp)
+
+    def __len__(self):
+        return len(self.x)
+
+    def emit(self, x, y, name, count=None):
+        effect = PARTICLE_EFFECTS[name]
+        origins_x = np.atleast_1d(np.asarray(x, dtype=float))
+        origins_y = np.atleast_1d(np.asarray(y, dtype=float))
+        free = self.budget - len(self.x)
+        count = (count or effect["count"]) * len(origins_x)
+        count = min(free, int(count * min(1.0, 2 * free / self.budget)))
+        if count <= 0:
+            return
+
+        source = np.arange(count) % len(origins_x)
+        heading = np.random.uniform(0, 2 * np.pi, count)
+        speed = np.random.uniform(*effect["speed"], count)
+        self.x = np.concatenate((self.x, origins_x[source]))
+        self.y = np.concatenate((self.y, origins_y[source]))
+        self.vx = np.concatenate((self.vx, np.cos(heading) * speed))
+        self.vy = np.concatenate((self.vy, np.sin(heading) * speed))
+        self.age = np.concatenate((self.age, np.zeros(count)))
+        self.life = np.concatenate((self.life, np.random.uniform(*effect["life"], count)))
+        self.kind = np.concatenate((self.kind, np.full(count, EFFECT_NAMES.index(name) * PARTICLE_FADE_STEPS)))
+
+    def clear(self):
+        self._keep(np.zeros(len(self.x), dtype=bool))
+
+    def _keep(self, keep):
+        self.x = self.x[keep]
+        self.y = self.y[keep]
+        self.vx = self.vx[keep]
+        self.vy = self.vy[keep]
+        self.age = self.age[keep]
+        self.life = self.life[keep]
+        self.kind = self.kind[keep]
+
+    def step(self, dt):
+        if not len(self.x):
+            return
+        scale = dt / 16
+        self.x += self.vx * scale
+        self.y += self.vy * scale
+        drag = PARTICLE_DRAG ** scale
+        self.vx *= drag
+        self.vy *= drag
+        self.age += dt
+
+        alive = self.age < self.life
+        if not alive.all():
+            self._keep(alive)
+
+    def blit_sequence(self):
+        if not len(self.x):
+            return []
+        frames = load_frames()
+        index = self.kind + (self.age * PARTICLE_FADE_STEPS // self.life).astype(np.intp)
+        half = _half_sizes[index]
+        lefts = (self.x.astype(np.intp) - half[:, 0]).tolist()
+        tops = (self.y.astype(np.intp) - half[:, 1]).tolist()
+        return [(frames[i][0], (left, top), frames[i][1])
+                for left, top, i in zip(lefts, tops, index.tolist())]
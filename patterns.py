@@ -0,0 +1,26 @@
+import math
+import numpy as np
+
+def radial(phase, origin, target, spin):
+    count = phase["count"]
+    return spin + np.arange(count) * (2 * math.pi / count)
+
+def spiral(phase, origin, target, spin):
+    arms = phase.get("arms", 1)
+    return spin + np.arange(arms) * (2 * math.pi / arms)
+
+def aimed_fan(phase, origin, target, spin):
+    aim = math.atan2(target[1] - origin[1], target[0] - origin[0])
+    spread = math.radians(phase["spread"])
+    return aim + np.linspace(-spread / 2, spread / 2, phase["count"])
+
+PATTERNS = {
+    "radial": radial,
+    "spiral": spiral,
+    "aimed_fan": aimed_fan,
+}
+
+def fire_pattern(pool, phase, origin, target, spin):
+    angles = PATTERNS[phase["pattern"]](phase, origin, target, spin)
+    pool.emit_many(origin[0], origin[1], angles, phase["speed"], phase.get("ttl"))
+    return spin + math.radians(phase.get("spin", 0))
@@ -1,15 +1,29 @@
 import pygame
-from projectile import Projectile
+from projectile import spawn_projectile
 from config import *
-from enemy import *
-from item import *
+from gamelog import log
+from telemetry import telemetry
+from soundbank import sound_bank
+from assets import asset_store
+from atlas import sprite_atlas
+
+SHOT_DIRECTIONS = {"up": (0, -1), "down": (0, 1), "left": (-1, 0), "right": (1, 0)}
+SHOT_ANGLES = {"up": 180, "down": 0, "left": 90, "right": 90}
+
+class Player(pygame.sprite.DirtySprite):
+    __slots__ = ("original_image", "upgraded_image", "region", "upgraded", "hp", "speed", "damage",
+                 "float_x", "float_y", "next_rect", "shoot_cooldown", "shoot_delay", "last_update",
+                 "can_move", "facing_direction", "shooting_direction", "invincible", "invincible_timer",
+                 "invincible_duration", "flash_interval", "dead", "death_time", "death_image")
+    _layer = LAYER_PLAYER
 
-class Player:
     def __init__(self, x, y):
+        pygame.sprite.DirtySprite.__init__(self)
         self.original_image = self._load_sprite("assets/vacuum.png")
         self.upgraded_image = self._load_sprite("assets/black_vacuum.png")
-        self.image = self.original_image.copy()
-        self.rect = self.image.get_rect(center=(x, y))
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.set_region(self.original_image)
+        self.rect.center = (x, y)
         
         self.upgraded = False
 
@@ -22,7 +36,6 @@ class Player:
 
         self.next_rect = self.rect.copy()
         
-        self.projectiles = []
         self.shoot_cooldown = PLAYER_SHOOTING_COOLDOWN
         self.shoot_delay = PLAYER_SHOOT_DELAY
         
@@ -35,47 +48,37 @@ class Player:
         self.invincible = False
         self.invincible_timer = 0
         self.invincible_duration = PLAYER_INVISIBILITY_DURATION
-        self.flash_timer = 0
         self.flash_interval = PLAYER_FLASH_INTERVAL
 
         self.dead = False
         self.death_time = 0
         self.death_image = self._load_death_image()
 
-        self.shoot_sound = None
-        self.hurt_sound = None
-        self.load_sounds()
-        
-    def load_sounds(self):
-        try:
-            self.shoot_sound = pygame.mixer.Sound(SOUND_PLAYER_SHOOT)
-            self.hurt_sound = pygame.mixer.Sound(SOUND_PLAYER_HURT)
-            self.shoot_sound.set_volume(0.3)
-            self.hurt_sound.set_volume(0.5)
-        except Exception as e:
-            print(f"Could not load player sounds: {e}")
-            self.shoot_sound = None
-            self.hurt_sound = None
-
     def _load_sprite(self, path):
         try:
-            image = pygame.image.load(path).convert_alpha()
-            return pygame.transform.scale(image, (50, 50))  
+            return asset_store.region(path, size=(50, 50))
         except:
-            print(f"Error loading sprite: {path}")
+            log.warning("assets", "Error loading sprite: %s", path)
             surf = pygame.Surface((40, 40), pygame.SRCALPHA)
             pygame.draw.rect(surf, (0, 255, 0), (0, 0, 40, 40))
-            return surf
+            return sprite_atlas.add(path, surf)
     
     def _load_death_image(self):
         try:
-            image = pygame.image.load("assets/explosion.png").convert_alpha()
-            return pygame.transform.scale(image, (80, 80))
+            return asset_store.region("assets/explosion.png", size=(80, 80))
         except:
-            print("Error loading death image, using fallback")
+            log.warning("assets", "Error loading death image, using fallback")
             surf = pygame.Surface((80, 80), pygame.SRCALPHA)
             pygame.draw.circle(surf, (255, 100, 0), (40, 40), 40)
-            return surf
+            return sprite_atlas.add("assets/explosion.png", surf)
+
+    def set_region(self, region):
+        center = self.rect.center
+        self.region = region
+        self.image = region.sheet
+        self.source_rect = region.rect
+        self.rect = pygame.Rect((0, 0), region.rect.size)
+        self.rect.center = center
 
     def rotate_to_direction(self):
         if not self.shooting_direction:
@@ -91,17 +94,16 @@ class Player:
         elif self.shooting_direction == "right":
             angle = -90
     
-        self.image = pygame.transform.rotate(self.original_image, angle)
-        self.rect = self.image.get_rect(center=self.rect.center)
+        self.set_region(sprite_atlas.rotated(self.original_image, angle))
     
     def update_sprite(self):
         if self.shooting_direction:
             self.rotate_to_direction()
         else:
-            self.image = self.original_image.copy()
             if self.facing_direction == "down":
-                self.image = pygame.transform.flip(self.image, True, False)
-            self.rect = self.image.get_rect(center=self.rect.center)
+                self.set_region(sprite_atlas.flipped(self.original_image, True, False))
+            else:
+                self.set_region(self.original_image)
     
     def handle_movement(self, keys, level):
         if not self.can_move:
@@ -138,15 +140,10 @@ class Player:
                 self.float_x = next_float_x
                 self.rect.centerx = int(self.float_x)
             else:
-                walls = [wall for wall in level.current_room.physical_room.walls 
-                        if (dx > 0 and wall.left > self.rect.right) or 
-                           (dx < 0 and wall.right < self.rect.left)]
-            
-                if walls: 
-                    if dx > 0: 
-                        self.rect.right = min(wall.left for wall in walls)
-                    else:  
-                        self.rect.left = max(wall.right for wall in walls)
+                if dx > 0:
+                    self.rect.right = (next_rect.right - 1) // TILE_SIZE * TILE_SIZE
+                else:
+                    self.rect.left = (next_rect.left // TILE_SIZE + 1) * TILE_SIZE
                 self.float_x = self.rect.centerx
 
         if dy != 0:
@@ -158,15 +155,10 @@ class Player:
                 self.float_y = next_float_y
                 self.rect.centery = int(self.float_y)
             else:
-                walls = [wall for wall in level.current_room.physical_room.walls 
-                        if (dy > 0 and wall.top > self.rect.bottom) or 
-                           (dy < 0 and wall.bottom < self.rect.top)]
-            
-                if walls: 
-                    if dy > 0:  
-                        self.rect.bottom = min(wall.top for wall in walls)
-                    else:  
-                        self.rect.top = max(wall.bottom for wall in walls)
+                if dy > 0:
+                    self.rect.bottom = (next_rect.bottom - 1) // TILE_SIZE * TILE_SIZE
+                else:
+                    self.rect.top = (next_rect.top // TILE_SIZE + 1) * TILE_SIZE
                 self.float_y = self.rect.centery
 
         room = level.current_room.physical_room
@@ -177,16 +169,21 @@ class Player:
         self.float_x = self.rect.centerx
         self.float_y = self.rect.centery
 
+    def shift_timers(self, ms):
+        self.last_update += ms
+        self.invincible_timer += ms
+
     def unlock_movement(self):
         if not self.can_move and pygame.time.get_ticks() - self.last_update > 250:
             self.can_move = True
     
     def take_damage(self, amount):
         if not self.invincible and not self.dead:
-            if self.hurt_sound:
-                self.hurt_sound.play()
+            sound_bank.play(SOUND_PLAYER_HURT, "player", 0.5)
             self.hp -= amount
-            print(f"Player took {amount} damage! HP left: {self.hp}")
+            log.debug("player", "Player took %d damage! HP left: %d", amount, self.hp)
+            telemetry.emit("damage_taken", amount=amount, hp=self.hp)
+            telemetry.count("damage_taken", amount)
             if self.hp <= 0:
                 self.die()
             else:
@@ -196,26 +193,19 @@ class Player:
     def die(self):
         self.dead = True
         self.death_time = pygame.time.get_ticks()
+        self.set_region(self.death_image)
+        self.visible = 1
 
     def update_invincibility(self):
         if self.invincible:
             current_time = pygame.time.get_ticks()
             if current_time - self.invincible_timer >= self.invincible_duration:
                 self.invincible = False
-                self.flash_timer = 0
-
-    def check_enemy_collisions(self, enemies):
-        if self.invincible:
-            return
-        
-        for enemy in enemies:
-            if isinstance(enemy, ShooterEnemy):
-                if enemy.check_hit_player(self.rect):
-                    self.take_damage(1)
-            elif enemy.check_hit_player(self.rect):
-                self.take_damage(1)
+                self.visible = 1
+            else:
+                self.visible = int((current_time - self.invincible_timer) // self.flash_interval % 2 == 0)
 
-    def handle_shooting(self, keys):
+    def handle_shooting(self, keys, level):
         if self.shoot_cooldown <= 0:
             self.shooting_direction = None
             direction = None
@@ -231,20 +221,23 @@ class Player:
                 
             if direction:
                 self.shooting_direction = direction
-                projectile = Projectile(
+                dir_x, dir_y = SHOT_DIRECTIONS[direction]
+                spawn_projectile(
+                    level.current_room.physical_room.world,
                     self.rect.centerx,
                     self.rect.centery,
-                    direction
+                    dir_x,
+                    dir_y,
+                    TEAM_PLAYER_SHOT,
+                    SHOT_ANGLES[direction],
+                    damage=self.damage
                 )
-                self.projectiles.append(projectile)
-                if self.shoot_sound:
-                    self.shoot_sound.play()
+                sound_bank.play(SOUND_PLAYER_SHOOT, "player", 0.3)
+                telemetry.count("shots_fired")
                 self.shoot_cooldown = self.shoot_delay
                 self.update_sprite()  
 
-    def update_projectiles(self, level):
-        self.projectiles = [p for p in self.projectiles if not p.update(level)]
-        
+    def update_shooting(self):
         if not any([pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT]):
             self.shooting_direction = None
             self.update_sprite()
@@ -252,33 +245,6 @@ class Player:
         if self.shoot_cooldown > 0:
             self.shoot_cooldown -= 1
 
-    def draw_projectiles(self, screen):
-        for projectile in self.projectiles:
-            projectile.draw(screen)
-
-    def draw(self, screen):
-        if self.dead:
-            death_rect = self.death_image.get_rect(center=self.rect.center)
-            screen.blit(self.death_image, death_rect)
-        else:
-            if self.invincible:
-                current_time = pygame.time.get_ticks()
-                if (current_time - self.flash_timer) >= self.flash_interval:
-                    self.flash_timer = current_time
-                    if (current_time - self.invincible_timer) // self.flash_interval % 2 == 0:
-                        screen.blit(self.image, self.rect)
-            else:
-                screen.blit(self.image, self.rect)
-
-    def check_projectile_hits(self, enemies):
-        for projectile in self.projectiles[:]:  
-            for enemy in enemies[:]: 
-                if enemy.alive and projectile.rect.colliderect(enemy.rect):
-                    enemy.take_damage(self.damage)
-                    if projectile in self.projectiles:
-                        self.projectiles.remove(projectile)
-                    break  
-
     def apply_item_effect(self, effect):
         if "hp_change" in effect:
             self.hp += effect["hp_change"]
@@ -295,5 +261,5 @@ class Player:
     def upgrade_player(self):
         self.upgraded = True
         self.original_image = self.upgraded_image
-        self.image = self.upgraded_image.copy()
+        self.set_region(self.upgraded_image)
         self.update_sprite()
\ No newline at end of file
@@ -1,84 +1,184 @@
 import pygame
+import numpy as np
 from config import *
+from assets import asset_store
+from atlas import sprite_atlas
+from soundbank import sound_bank
 
-class Projectile:
-    _texture = None
-    _hit_sound = None
-
-    @classmethod
-    def load_texture(cls, path="assets/projectile.png", width=20, height=20):
-        if cls._texture is None:
-            try:
-                image = pygame.image.load(path).convert_alpha()
-                cls._texture = pygame.transform.scale(image, (width, height))
-            except:
-                surf = pygame.Surface((width, height), pygame.SRCALPHA)
-                pygame.draw.circle(surf, (255, 255, 0), (width//2, height//2), width//2)
-                cls._texture = surf
-        return cls._texture
-
-    @classmethod
-    def load_sounds(cls):
-        if cls._hit_sound is None:
-            try:
-                cls._hit_sound = pygame.mixer.Sound(SOUND_PROJECTILE_HIT)
-                cls._hit_sound.set_volume(0.3)
-            except:
-                print("Could not load projectile hit sound")
-                cls._hit_sound = None
-
-    def __init__(self, x, y, direction):
-        self.image = Projectile.load_texture()
-        self.rect = self.image.get_rect(center=(x, y))
-        self.speed = 2
-        self.direction = direction
-        self.lifetime = 200
-        self.load_sounds()
-        
-        if direction in ["left", "right"]:
-            self.image = pygame.transform.rotate(self.image, 90)
-        if direction == "up":
-            self.image = pygame.transform.rotate(self.image, 180)
-
-    def update(self, level=None):
-        if self.direction == "up":
-            self.rect.y -= self.speed
-        elif self.direction == "down":
-            self.rect.y += self.speed
-        elif self.direction == "left":
-            self.rect.x -= self.speed
-        elif self.direction == "right":
-            self.rect.x += self.speed
-        
-        if level and level.check_collision(self.rect):
-            if Projectile._hit_sound:
-                Projectile._hit_sound.play()
-            self.lifetime = 0 
-        
-        self.lifetime -= 1
-        return self.lifetime <= 0 
-
-    def draw(self, screen):
-        screen.blit(self.image, self.rect)
-
-
-class HomingProjectile(Projectile):
-    def __init__(self, x, y, dir_x, dir_y):
-        super().__init__(x, y, "right")  
-        self.dir_x = dir_x
-        self.dir_y = dir_y
-        angle = -pygame.math.Vector2(dir_x, dir_y).angle_to(pygame.math.Vector2(1, 0))
-        self.image = pygame.transform.rotate(self.image, angle)
-        self.rect = self.image.get_rect(center=(x, y))
-
-    def update(self, level=None):
-        self.rect.x += self.dir_x * self.speed
-        self.rect.y += self.dir_y * self.speed
-        
-        if level and level.check_collision(self.rect):
-            if Projectile._hit_sound:
-                Projectile._hit_sound.play()
-            self.lifetime = 0 
-        
-        self.lifetime -= 1
-        return self.lifetime <= 0
+PROJECTILE_SPEED = 2
+PROJECTILE_LIFETIME = 200
+HOMING_TURN_STEP = np.radians(HOMING_TURN_RATE)
+
+_texture = None
+_rotated_textures = {}
+_rotated_list = None
+_half_sizes = None
+_blit_parts = None
+
+def load_texture(path="assets/projectile.png", width=20, height=20):
+    global _texture
+    if _texture is None:
+        try:
+            _texture = asset_store.region(path, size=(width, height))
+        except:
+            surf = pygame.Surface((width, height), pygame.SRCALPHA)
+            pygame.draw.circle(surf, (255, 255, 0), (width//2, height//2), width//2)
+            _texture = sprite_atlas.add(path, surf)
+    return _texture
+
+def rotated_textures():
+    global _rotated_list, _half_sizes, _blit_parts
+    if _rotated_list is None:
+        _rotated_list = [get_rotated_texture(angle) for angle in range(360)]
+        _blit_parts = [(region.sheet, region.rect) for region in _rotated_list]
+        _half_sizes = np.array([(region.rect.width // 2, region.rect.height // 2) for region in _rotated_list], dtype=np.intp)
+    return _rotated_list
+
+def get_rotated_texture(angle):
+    angle = int(round(angle)) % 360
+    if angle not in _rotated_textures:
+        _rotated_textures[angle] = sprite_atlas.rotated(load_texture(), angle)
+    return _rotated_textures[angle]
+
+def spawn_projectile(world, x, y, dir_x, dir_y, team, angle, speed=PROJECTILE_SPEED, damage=1):
+    region = get_rotated_texture(angle)
+    eid = world.create_entity(x, y)
+    world.velocity.add(eid, dir_x * speed, dir_y * speed)
+    world.collider.add(eid, region.rect.width, region.rect.height, team, damage)
+    world.lifetime.add(eid, PROJECTILE_LIFETIME)
+    world.add_sprite(eid, region, LAYER_PROJECTILES)
+    return eid
+
+class ProjectilePool:
+    def __init__(self, room):
+        self.room = room
+        self.x = np.zeros(0)
+        self.y = np.zeros(0)
+        self.vx = np.zeros(0)
+        self.vy = np.zeros(0)
+        self.angle = np.zeros(0)
+        self.ttl = np.zeros(0, dtype=np.int32)
+        self.homing = np.zeros(0, dtype=bool)
+        self.pending = []
+        self.tiles = None
+
+    def __len__(self):
+        return len(self.x) + len(self.pending)
+
+    def emit(self, x, y, dir_x, dir_y, angle, speed=PROJECTILE_SPEED, homing=False):
+        self.pending.append((x, y, dir_x * speed, dir_y * speed, angle, PROJECTILE_LIFETIME, homing))
+
+    def emit_many(self, x, y, headings, speed=PROJECTILE_SPEED, ttl=None):
+        count = len(headings)
+        self._append(np.full(count, float(x)), np.full(count, float(y)),
+                     np.cos(headings) * speed, np.sin(headings) * speed, 90 + np.degrees(headings),
+                     np.full(count, ttl or PROJECTILE_LIFETIME, dtype=np.int32), np.zeros(count, dtype=bool))
+
+    def clear(self):
+        self.pending.clear()
+        self._keep(np.zeros(len(self.x), dtype=bool))
+
+    def _merge_pending(self):
+        if not self.pending:
+            return
+        x, y, vx, vy, angle, ttl, homing = zip(*self.pending)
+        self.pending.clear()
+        self._append(x, y, vx, vy, angle, np.array(ttl, dtype=np.int32), np.array(homing, dtype=bool))
+
+    def _append(self, x, y, vx, vy, angle, ttl, homing):
+        self.x = np.concatenate((self.x, x))
+        self.y = np.concatenate((self.y, y))
+        self.vx = np.concatenate((self.vx, vx))
+        self.vy = np.concatenate((self.vy, vy))
+        self.angle = np.concatenate((self.angle, angle))
+        self.ttl = np.concatenate((self.ttl, ttl))
+        self.homing = np.concatenate((self.homing, homing))
+
+    def _keep(self, keep):
+        self.x = self.x[keep]
+        self.y = self.y[keep]
+        self.vx = self.vx[keep]
+        self.vy = self.vy[keep]
+        self.angle = self.angle[keep]
+        self.ttl = self.ttl[keep]
+        self.homing = self.homing[keep]
+
+    def steer(self, targets):
+        homing = np.flatnonzero(self.homing)
+        if not len(homing):
+            return
+        targets = np.asarray(targets, dtype=float).reshape(-1, 2)
+        dx = targets[:, 0, None] - self.x[homing]
+        dy = targets[:, 1, None] - self.y[homing]
+        nearest = np.argmin(dx * dx + dy * dy, axis=0)
+        columns = np.arange(len(homing))
+
+        vx, vy = self.vx[homing], self.vy[homing]
+        heading = np.arctan2(vy, vx)
+        desired = np.arctan2(dy[nearest, columns], dx[nearest, columns])
+        turn = (desired - heading + np.pi) % (2 * np.pi) - np.pi
+        heading += np.clip(turn, -HOMING_TURN_STEP, HOMING_TURN_STEP)
+        speed = np.hypot(vx, vy)
+        self.vx[homing] = np.cos(heading) * speed
+        self.vy[homing] = np.sin(heading) * speed
+        self.angle[homing] = 90 + np.degrees(heading)
+
+    def step(self, targets):
+        self._merge_pending()
+        if not len(self.x):
+            return
+
+        self.steer(targets)
+        self.x += self.vx
+        self.y += self.vy
+        self.ttl -= 1
+
+        room = self.room
+        if self.tiles is None:
+            self.tiles = np.frombuffer(room.tiles, dtype=np.uint8)
+        inside = (self.x >= 0) & (self.x < room.width) & (self.y >= 0) & (self.y < room.height)
+        cells = np.where(inside, (self.y // TILE_SIZE).astype(np.intp) * room.cols + (self.x // TILE_SIZE).astype(np.intp), 0)
+        alive = self.ttl > 0
+        wall_hit = alive & (~inside | (self.tiles[cells] & TILE_BLOCKS_SHOTS != 0))
+
+        keep = alive & ~wall_hit
+        if wall_hit.any():
+            sound_bank.play(SOUND_PROJECTILE_HIT, "enemy", 0.3)
+            room.particles.emit(self.x[wall_hit], self.y[wall_hit], "shot_hit")
+        if not keep.all():
+            self._keep(keep)
+
+    def collide(self, rect, mask=None):
+        if not len(self.x):
+            return False
+        regions = rotated_textures()
+        angles = np.rint(self.angle).astype(np.intp) % 360
+        half = _half_sizes[angles]
+        left = self.x.astype(np.intp) - half[:, 0]
+        top = self.y.astype(np.intp) - half[:, 1]
+        near = np.flatnonzero((left < rect.right) & (top < rect.bottom) &
+                              (left + 2 * half[:, 0] > rect.left) & (top + 2 * half[:, 1] > rect.top))
+
+        for i in near:
+            if mask is not None:
+                width, height = mask.get_size()
+                offset = (int(left[i]) - (rect.centerx - width // 2), int(top[i]) - (rect.centery - height // 2))
+                if mask.overlap(regions[angles[i]].mask(), offset) is None:
+                    continue
+            keep = np.ones(len(self.x), dtype=bool)
+            keep[i] = False
+            self._keep(keep)
+            return True
+        return False
+
+    def blit_sequence(self):
+        if not len(self.x):
+            return []
+        rotated_textures()
+        angles = np.rint(self.angle).astype(np.intp) % 360
+        half = _half_sizes[angles]
+        lefts = (self.x.astype(np.intp) - half[:, 0]).tolist()
+        tops = (self.y.astype(np.intp) - half[:, 1]).tolist()
+        parts = _blit_parts
+        return [(parts[angle][0], (left, top), parts[angle][1])
+                for left, top, angle in zip(lefts, tops, angles.tolist())]
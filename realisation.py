@@ -8,6 +8,11 @@ from levelgenerator import LevelGenerator
 from level import Level
 from player import Player
 from item import *
+from soundbank import sound_bank
+from rendertarget import RenderTarget
+from gamelog import log
+from telemetry import telemetry
+from capture import capture
 
 def save_score_to_xml(time_seconds):
     filename = "scores.xml"
@@ -24,47 +29,56 @@ def save_score_to_xml(time_seconds):
     
     tree.write(filename)
 
+def wait_for_redraw(timeout=0):
+    redraw = False
+    for event in [pygame.event.wait(timeout)] + pygame.event.get():
+        if event.type == pygame.QUIT:
+            pygame.quit()
+            sys.exit()
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            return None
+        if event.type in (pygame.VIDEORESIZE, pygame.WINDOWEXPOSED):
+            redraw = True
+    return redraw
+
 def show_info(screen):
     info_running = True
-    clock = pygame.time.Clock()
+    redraw = True
 
     while info_running:
-        screen.fill(BLACK)
-
-        box_width, box_height = 600, 400
-        box_x = (screen.get_width() - box_width) // 2
-        box_y = (screen.get_height() - box_height) // 2
-        pygame.draw.rect(screen, LIGHT_GRAY, (box_x, box_y, box_width, box_height), border_radius=10)
-        pygame.draw.rect(screen, BLACK, (box_x, box_y, box_width, box_height), 2, border_radius=10)
-
-        title = font_large.render("Info", True, BLACK)
-        title_rect = title.get_rect(center=(screen.get_width() // 2, box_y + 40))
-        screen.blit(title, title_rect)
-
-        info_text = [
-            "Move with WASD keys.",
-            "Shoot with arrow keys.",
-            "Defeat the boss to win.",
-            "Try not to die.",
-            "",
-            "",
-            "Press ESC to close this window."
-        ]
-        
-        for i, line in enumerate(info_text):
-            text_surf = font_medium.render(line, True, BLACK)
-            text_rect = text_surf.get_rect(center=(screen.get_width() // 2, box_y + 100 + i * 40))
-            screen.blit(text_surf, text_rect)
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                info_running = False 
+        if redraw:
+            screen.fill(BLACK)
+
+            box_width, box_height = 600, 400
+            box_x = (screen.get_width() - box_width) // 2
+            box_y = (screen.get_height() - box_height) // 2
+            pygame.draw.rect(screen, LIGHT_GRAY, (box_x, box_y, box_width, box_height), border_radius=10)
+            pygame.draw.rect(screen, BLACK, (box_x, box_y, box_width, box_height), 2, border_radius=10)
+
+            title = font_large.render("Info", True, BLACK)
+            title_rect = title.get_rect(center=(screen.get_width() // 2, box_y + 40))
+            screen.blit(title, title_rect)
+
+            info_text = [
+                "Move with WASD keys.",
+                "Shoot with arrow keys.",
+                f"Defeat the boss on all {RUN_FLOORS} floors to win.",
+                "Try not to die.",
+                "Press P to pause.",
+                "",
+                "Press ESC to close this window."
+            ]
+            
+            for i, line in enumerate(info_text):
+                text_surf = font_medium.render(line, True, BLACK)
+                text_rect = text_surf.get_rect(center=(screen.get_width() // 2, box_y + 100 + i * 40))
+                screen.blit(text_surf, text_rect)
+
+            pygame.display.flip()
 
-        pygame.display.flip()
-        clock.tick(60)
+        redraw = wait_for_redraw()
+        if redraw is None:
+            info_running = False
 
 def show_records(screen):
     try:
@@ -77,47 +91,44 @@ def show_records(screen):
         scores = []
 
     record_running = True
-    clock = pygame.time.Clock()
+    redraw = True
 
     while record_running:
-        screen.fill(BLACK)
-
-        box_width, box_height = 600, 400
-        box_x = (screen.get_width() - box_width) // 2
-        box_y = (screen.get_height() - box_height) // 2
-        pygame.draw.rect(screen, LIGHT_GRAY, (box_x, box_y, box_width, box_height), border_radius=10)
-        pygame.draw.rect(screen, BLACK, (box_x, box_y, box_width, box_height), 2, border_radius=10)
-
-        title = font_large.render("Best Runs", True, BLACK)
-        title_rect = title.get_rect(center=(screen.get_width() // 2, box_y + 40))
-        screen.blit(title, title_rect)
-
-        if not scores:
-            no_records = font_medium.render("No records yet!", True, BLACK)
-            no_rect = no_records.get_rect(center=(screen.get_width() // 2, box_y + box_height // 2))
-            screen.blit(no_records, no_rect)
-        else:
-            for i, score in enumerate(scores):
-                minutes = score // 60
-                seconds = score % 60
-                time_text = f"{i+1}. {minutes:02d}:{seconds:02d}"
-                text_surf = font_medium.render(time_text, True, BLACK)
-                text_rect = text_surf.get_rect(center=(screen.get_width() // 2, box_y + 100 + i * 50))
-                screen.blit(text_surf, text_rect)
+        if redraw:
+            screen.fill(BLACK)
+
+            box_width, box_height = 600, 400
+            box_x = (screen.get_width() - box_width) // 2
+            box_y = (screen.get_height() - box_height) // 2
+            pygame.draw.rect(screen, LIGHT_GRAY, (box_x, box_y, box_width, box_height), border_radius=10)
+            pygame.draw.rect(screen, BLACK, (box_x, box_y, box_width, box_height), 2, border_radius=10)
+
+            title = font_large.render("Best Runs", True, BLACK)
+            title_rect = title.get_rect(center=(screen.get_width() // 2, box_y + 40))
+            screen.blit(title, title_rect)
+
+            if not scores:
+                no_records = font_medium.render("No records yet!", True, BLACK)
+                no_rect = no_records.get_rect(center=(screen.get_width() // 2, box_y + box_height // 2))
+                screen.blit(no_records, no_rect)
+            else:
+                for i, score in enumerate(scores):
+                    minutes = score // 60
+                    seconds = score % 60
+                    time_text = f"{i+1}. {minutes:02d}:{seconds:02d}"
+                    text_surf = font_medium.render(time_text, True, BLACK)
+                    text_rect = text_surf.get_rect(center=(screen.get_width() // 2, box_y + 100 + i * 50))
+                    screen.blit(text_surf, text_rect)
 
-        close_text = font_medium.render("Press ESC to close", True, BLACK)
-        close_rect = close_text.get_rect(center=(screen.get_width() // 2, box_y + box_height - 50))
-        screen.blit(close_text, close_rect)
+            close_text = font_medium.render("Press ESC to close", True, BLACK)
+            close_rect = close_text.get_rect(center=(screen.get_width() // 2, box_y + box_height - 50))
+            screen.blit(close_text, close_rect)
 
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                record_running = False
+            pygame.display.flip()
 
-        pygame.display.flip()
-        clock.tick(60)
+        redraw = wait_for_redraw()
+        if redraw is None:
+            record_running = False
 
 def draw_level(screen, level):
     current_room_pos = (level.width // 2, level.height // 2) 
@@ -145,32 +156,40 @@ def start_game(screen):
         pygame.mixer.music.load(MUSIC_LEVEL)
         pygame.mixer.music.set_volume(0.3) 
     except Exception as e:
-        print(f"Can't load music': {e}")
+        log.warning("audio", "Can't load music: %s", e)
 
     generator = LevelGenerator()
     level_grid = generator.generate()
     
-    print("\n==== Map ====")
-    for y in range(len(level_grid)):
-        row = []
-        for x in range(len(level_grid[0])):
-            if level_grid[y][x]:
-                if level_grid[y][x].type == "start":
-                    row.append("S")
-                elif level_grid[y][x].type == "boss":
-                    row.append("B")
-                elif level_grid[y][x].type == "treasure":
-                    row.append("T")
+    if log.level <= LOG_DEBUG:
+        rows = []
+        for y in range(len(level_grid)):
+            row = []
+            for x in range(len(level_grid[0])):
+                if level_grid[y][x]:
+                    if level_grid[y][x].type == "start":
+                        row.append("S")
+                    elif level_grid[y][x].type == "boss":
+                        row.append("B")
+                    elif level_grid[y][x].type == "treasure":
+                        row.append("T")
+                    else:
+                        row.append(".")
                 else:
                     row.append(".")
-            else:
-                row.append(".")
-        print(" ".join(row))
-    print("=============\n")
+            rows.append(" ".join(row))
+        log.debug("level", "==== Map ====\n%s", "\n".join(rows))
 
     level = Level(generator)
     player = Player(WIDTH//2, HEIGHT//2)
-    level.player = player
+    level.set_player(player)
+    level.prepare_next_floor()
+    target = RenderTarget()
+    canvas = target.surface
+    if CAPTURE_ON_START:
+        capture.start(canvas)
+    telemetry.start_run()
+    telemetry.emit("room_enter", room=list(level.current_room.position), type=level.current_room.type)
 
     pygame.mixer.music.play(-1)
 
@@ -181,26 +200,56 @@ def start_game(screen):
     game_active = True
     player_won = False
 
+    paused = False
+    pause_started = 0
+    frozen = None
+    exploding = False
+
     clock = pygame.time.Clock()
     last_time = pygame.time.get_ticks()
 
     while running:
+        if (game_active and not paused) or frozen is None:
+            events = pygame.event.get()
+        else:
+            if exploding:
+                timeout = PARTICLE_FRAME_INTERVAL
+            else:
+                timeout = END_SCREEN_SHAKE_INTERVAL if player.dead else 0
+            events = [pygame.event.wait(timeout)] + pygame.event.get()
+
         current_time = pygame.time.get_ticks()
-        dt = current_time - last_time 
+        dt = min(current_time - last_time, MAX_FRAME_DT)
         last_time = current_time
 
-        for event in pygame.event.get():
+        for event in events:
+            target.handle_event(event)
             if event.type == pygame.QUIT:
                 running = False
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
+                    telemetry.end_run("abandoned", elapsed_time)
+                    capture.stop()
                     return True  
                 if not game_active and event.key == pygame.K_SPACE:
                     pygame.mixer.music.stop() 
+                    capture.stop()
                     return True 
-
-        if game_active:
+                if game_active and event.key == PAUSE_KEY:
+                    paused = not paused
+                    frozen = None
+                    if paused:
+                        pause_started = current_time
+                        pygame.mixer.music.pause()
+                    else:
+                        paused_time += current_time - pause_started
+                        level.shift_timers(current_time - pause_started)
+                        dt = 0
+                        pygame.mixer.music.unpause()
+
+        if game_active and not paused:
             elapsed_time = (current_time - start_time - paused_time) // 1000
+            telemetry.frame(dt)
     
             keys = pygame.key.get_pressed()
             player.handle_movement(keys, level)
@@ -208,23 +257,20 @@ def start_game(screen):
             door_direction = level.check_door_collision(player.rect)
             if door_direction:
                 level.change_room(door_direction, player)
-                player.last_update = pygame.time.get_ticks()  
     
-            player.handle_shooting(keys)
-            player.update_projectiles(level)
-            level.check_projectile_collisions(player.projectiles, player)
-            item_effect = level.check_item_collisions(player)
+            player.handle_shooting(keys, level)
+            player.update_shooting()
+            item_effect = level.update(player, dt)
 
-            if item_effect and "win_game" in item_effect:
+            if item_effect and "win_game" in item_effect and not level.is_last_floor():
+                level.advance_floor()
+            elif item_effect and "win_game" in item_effect:
                 game_active = False
                 player_won = True  
                 pygame.mixer.music.stop()
-                try:
-                    win_sound = pygame.mixer.Sound(SOUND_VICTORY)
-                    win_sound.play()
-                except:
-                    print("Could not play win sound")
+                sound_bank.play(SOUND_VICTORY, "ui")
                 save_score_to_xml(elapsed_time)
+                telemetry.end_run("win", elapsed_time)
 
             player.unlock_movement()  
             player.update_invincibility()
@@ -233,44 +279,70 @@ def start_game(screen):
                 game_active = False
                 player_won = False 
                 pygame.mixer.music.stop()
-                try:
-                    death_sound = pygame.mixer.Sound(SOUND_FAILURE)
-                    death_sound.play()
-                except:
-                    print("Could not play death sound")
-
-            screen.fill((0, 0, 0))
-            level.draw(screen, elapsed_time)
-            player.draw(screen)
-            player.draw_projectiles(screen)
-
-            for enemy in level.current_room.physical_room.enemies:
-                enemy.update(player.rect.center, level, dt)
-
-            player.check_projectile_hits(level.current_room.physical_room.enemies)
-            player.check_enemy_collisions(level.current_room.physical_room.enemies)
+                sound_bank.play(SOUND_FAILURE, "ui")
+                telemetry.end_run("death", elapsed_time)
+
+            canvas.fill((0, 0, 0))
+            level.draw(canvas, elapsed_time)
+            target.present()
+            clock.tick(240) 
         else:
-            screen.fill((0, 0, 0))
-            level.draw(screen)
-            player.draw(screen)
+            particles = level.current_room.physical_room.particles
+            exploding = player.dead and len(particles) > 0
+            if exploding:
+                particles.step(dt)
+
+            if frozen is None or exploding:
+                canvas.fill((0, 0, 0))
+                level.draw(canvas, elapsed_time if paused else None)
+                frozen = canvas.copy()
+            canvas.blit(frozen, (0, 0))
     
-            if hasattr(player, 'dead') and player.dead:
-                draw_death_screen(screen, player)
+            if paused:
+                draw_pause_screen(canvas)
+            elif player.dead and not exploding:
+                draw_death_screen(canvas, player)
             elif player_won: 
-                draw_win_screen(screen, elapsed_time)
+                draw_win_screen(canvas, elapsed_time)
 
-        pygame.display.flip()
-        clock.tick(240) 
+            target.present()
     
+    telemetry.end_run("abandoned", elapsed_time)
+    capture.stop()
     return False  
 
+_overlay = None
+_fonts = {}
+_texts = {}
+
+def get_overlay():
+    global _overlay
+    if _overlay is None:
+        _overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        _overlay.fill((0, 0, 0, 180))
+    return _overlay
+
+def render_text(size, text, color):
+    key = (size, text, color)
+    if key not in _texts:
+        if size not in _fonts:
+            _fonts[size] = pygame.font.Font(None, size)
+        _texts[key] = _fonts[size].render(text, True, color)
+    return _texts[key]
+
+def draw_pause_screen(screen):
+    screen.blit(get_overlay(), (0, 0))
+
+    pause_text = render_text(120, "PAUSED", WHITE)
+    screen.blit(pause_text, pause_text.get_rect(center=(WIDTH//2, HEIGHT//2)))
+
+    continue_text = render_text(36, "Press P to resume", WHITE)
+    screen.blit(continue_text, continue_text.get_rect(center=(WIDTH//2, HEIGHT//2 + 100)))
+
 def draw_death_screen(screen, player):
-    overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 180))
-    screen.blit(overlay, (0, 0))
+    screen.blit(get_overlay(), (0, 0))
     
-    wasted_font = pygame.font.Font(None, 120)
-    wasted_text = wasted_font.render("WASTED", True, RED)
+    wasted_text = render_text(120, "WASTED", RED)
     wasted_rect = wasted_text.get_rect(center=(WIDTH//2, HEIGHT//2))
     
     shake_offset = random.randint(-5, 5)
@@ -278,29 +350,23 @@ def draw_death_screen(screen, player):
     
     screen.blit(wasted_text, wasted_rect)
     
-    continue_font = pygame.font.Font(None, 36)
-    continue_text = continue_font.render("Press SPACE to restart", True, WHITE)
+    continue_text = render_text(36, "Press SPACE to restart", WHITE)
     continue_rect = continue_text.get_rect(center=(WIDTH//2, HEIGHT//2 + 100))
     screen.blit(continue_text, continue_rect)
 
 def draw_win_screen(screen, time_seconds):
-    overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 180))
-    screen.blit(overlay, (0, 0))
+    screen.blit(get_overlay(), (0, 0))
     
-    win_font = pygame.font.Font(None, 120)
-    win_text = win_font.render("VICTORY!", True, (0, 255, 0))
+    win_text = render_text(120, "VICTORY!", (0, 255, 0))
     win_rect = win_text.get_rect(center=(WIDTH//2, HEIGHT//2 - 50))
     screen.blit(win_text, win_rect)
     
-    time_font = pygame.font.Font(None, 48)
     minutes = time_seconds // 60
     seconds = time_seconds % 60
-    time_text = time_font.render(f"Time: {minutes:02d}:{seconds:02d}", True, WHITE)
+    time_text = render_text(48, f"Time: {minutes:02d}:{seconds:02d}", WHITE)
     time_rect = time_text.get_rect(center=(WIDTH//2, HEIGHT//2 + 50))
     screen.blit(time_text, time_rect)
     
-    continue_font = pygame.font.Font(None, 36)
-    continue_text = continue_font.render("Press SPACE to exit", True, WHITE)
+    continue_text = render_text(36, "Press SPACE to exit", WHITE)
     continue_rect = continue_text.get_rect(center=(WIDTH//2, HEIGHT//2 + 120))
-    screen.blit(continue_text, continue_rect)
\ No newline at end of file
+    screen.blit(continue_text, continue_rect)
@@ -0,0 +1,225 @@
+import os
+import sys
+import time
+import random
+import hashlib
+import numpy as np
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from config import *
+
+CHECK_SEED = 1234
+GOLDEN_DIR = "goldens"
+DIFF_DIR = "render_diffs"
+WARM_DRAWS = 30
+PIXEL_TOLERANCE = 16
+MAX_DIFF_RATIO = 0.001
+BULLET_PHASE = {"pattern": "radial", "count": 24, "speed": 2}
+
+def find_room(level, room_type):
+    for row in level.rooms:
+        for room in row:
+            if room and room.type == room_type:
+                return room
+    raise LookupError(f"No {room_type} room in the seeded layout")
+
+def enter(level, room):
+    level.current_room.physical_room.world.render_group = None
+    level.current_room = room
+    level.current_room_pos = room.position
+    level.minimap.enter(room)
+    level.calculate_offsets()
+    level.populate_sprites()
+
+def clear(room):
+    room.physical_room.clear_enemies()
+    room.physical_room.background = None
+
+def scene_start(level, player):
+    return 0, None
+
+def scene_normal_locked(level, player):
+    enter(level, find_room(level, "normal"))
+    return 5, None
+
+def scene_normal_cleared(level, player):
+    room = find_room(level, "normal")
+    clear(room)
+    enter(level, room)
+    return 12, None
+
+def scene_treasure(level, player):
+    enter(level, find_room(level, "treasure"))
+    return 40, None
+
+def scene_boss(level, player):
+    enter(level, find_room(level, "boss"))
+    return 95, None
+
+def scene_boss_cleared(level, player):
+    room = find_room(level, "boss")
+    clear(room)
+    enter(level, room)
+    return 150, None
+
+def scene_hud(level, player):
+    player.upgrade_player()
+    player.hp = 2
+    player.damage = 3
+    player.speed = 1.5
+    return 3725, None
+
+def scene_bullets(level, player):
+    from patterns import fire_pattern
+
+    room = find_room(level, "boss")
+    enter(level, room)
+    physical_room = room.physical_room
+    origin = (physical_room.width / 2, physical_room.height / 2)
+    player.rect.center = (WIDTH // 2, HEIGHT - 120)
+    spin = 0.0
+    for step in range(60):
+        if step % 15 == 0:
+            spin = fire_pattern(physical_room.enemy_shots, BULLET_PHASE, origin, player.rect.center, spin + 0.1)
+        physical_room.enemy_shots.step([player.rect.center])
+    physical_room.particles.emit(origin[0] + 200, origin[1] + 120, "explosion")
+    for _ in range(5):
+        physical_room.particles.step(16)
+    return 95, None
+
+def scene_paused(level, player):
+    from realisation import draw_pause_screen
+    return 61, draw_pause_screen
+
+def scene_death(level, player):
+    from realisation import draw_death_screen
+
+    enter(level, find_room(level, "normal"))
+    player.die()
+    return None, lambda canvas: draw_death_screen(canvas, player)
+
+def scene_win(level, player):
+    from realisation import draw_win_screen
+
+    room = find_room(level, "boss")
+    clear(room)
+    enter(level, room)
+    return None, lambda canvas: draw_win_screen(canvas, 754)
+
+SCENES = {
+    "start": scene_start,
+    "normal_locked": scene_normal_locked,
+    "normal_cleared": scene_normal_cleared,
+    "treasure": scene_treasure,
+    "boss": scene_boss,
+    "boss_cleared": scene_boss_cleared,
+    "hud": scene_hud,
+    "bullets": scene_bullets,
+    "paused": scene_paused,
+    "death": scene_death,
+    "win": scene_win,
+}
+
+def build_scene(name):
+    from levelgenerator import LevelGenerator
+    from level import Level
+    from player import Player
+
+    random.seed(CHECK_SEED)
+    np.random.seed(CHECK_SEED)
+    generator = LevelGenerator(seed=CHECK_SEED)
+    generator.generate()
+    level = Level(generator)
+    player = Player(WIDTH // 2, HEIGHT // 2)
+    level.set_player(player)
+    elapsed, overlay = SCENES[name](level, player)
+    return level, elapsed, overlay
+
+def draw(canvas, level, elapsed, overlay):
+    random.seed(CHECK_SEED)
+    started = time.perf_counter()
+    canvas.fill(BLACK)
+    level.draw(canvas, elapsed)
+    if overlay:
+        overlay(canvas)
+    return time.perf_counter() - started
+
+def pixels(surface):
+    return pygame.surfarray.array3d(surface)
+
+def image_hash(array):
+    return hashlib.sha1(np.ascontiguousarray(array).tobytes()).hexdigest()
+
+def compare(actual, golden):
+    if actual.shape != golden.shape:
+        return None, 1.0
+    mismatch = np.abs(actual.astype(np.int16) - golden).max(axis=2) > PIXEL_TOLERANCE
+    return mismatch, mismatch.mean()
+
+def save_diff(name, canvas, mismatch):
+    os.makedirs(DIFF_DIR, exist_ok=True)
+    pygame.image.save(canvas, os.path.join(DIFF_DIR, f"{name}_actual.png"))
+    if mismatch is not None:
+        marked = pixels(canvas)
+        marked[mismatch] = (255, 0, 255)
+        pygame.image.save(pygame.surfarray.make_surface(marked), os.path.join(DIFF_DIR, f"{name}_diff.png"))
+
+def check_scene(name, canvas, update):
+    level, elapsed, overlay = build_scene(name)
+    cold = draw(canvas, level, elapsed, overlay)
+    first = pixels(canvas)
+    warm = sum(draw(canvas, level, elapsed, overlay) for _ in range(WARM_DRAWS)) / WARM_DRAWS
+    timing = f"{cold * 1000:8.2f} {warm * 1000:8.2f}"
+
+    if not np.array_equal(first, pixels(canvas)):
+        save_diff(name, canvas, np.any(first != pixels(canvas), axis=2))
+        return False, f"{timing}  warm frame differs from the first one"
+
+    path = os.path.join(GOLDEN_DIR, f"{name}.png")
+    if update:
+        os.makedirs(GOLDEN_DIR, exist_ok=True)
+        pygame.image.save(canvas, path)
+        return True, f"{timing}  golden updated"
+    if not os.path.exists(path):
+        return False, f"{timing}  no golden, run with 'update'"
+
+    golden = pixels(pygame.image.load(path))
+    if image_hash(first) == image_hash(golden):
+        return True, f"{timing}  identical"
+    mismatch, ratio = compare(first, golden)
+    if ratio <= MAX_DIFF_RATIO:
+        return True, f"{timing}  close ({ratio:.3%} off)"
+    save_diff(name, canvas, mismatch)
+    return False, f"{timing}  DIFFERS ({ratio:.3%} off), see {DIFF_DIR}/"
+
+def main():
+    update = "update" in sys.argv[1:]
+    names = [arg for arg in sys.argv[1:] if arg != "update"] or list(SCENES)
+    unknown = [name for name in names if name not in SCENES]
+    if unknown:
+        print(f"unknown scenes: {', '.join(unknown)}; known: {', '.join(SCENES)}")
+        sys.exit(2)
+
+    pygame.init()
+    pygame.display.set_mode((WIDTH, HEIGHT))
+
+    from rendertarget import RenderTarget
+
+    canvas = RenderTarget().surface
+    failures = 0
+    print(f"{'scene':16} {'cold ms':>8} {'warm ms':>8}  result")
+    for name in names:
+        ok, result = check_scene(name, canvas, update)
+        failures += not ok
+        print(f"{name:16} {result}")
+
+    if failures:
+        print(f"{failures} of {len(names)} scenes failed")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
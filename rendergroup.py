@@ -0,0 +1,18 @@
+import pygame
+
+class RenderGroup(pygame.sprite.LayeredDirty):
+    def __init__(self, *sprites, **kwargs):
+        pygame.sprite.LayeredDirty.__init__(self, *sprites, **kwargs)
+        self.batches = {}
+
+    def draw(self, surface, bgsurf=None, special_flags=None):
+        batches = sorted(self.batches.items())
+        sequence = []
+        for spr in self.sprites():
+            while batches and batches[0][0] < spr._layer:
+                sequence.extend(batches.pop(0)[1].blit_sequence())
+            if spr.visible:
+                sequence.append((spr.image, spr.rect, spr.source_rect))
+        for _, batch in batches:
+            sequence.extend(batch.blit_sequence())
+        surface.blits(sequence, doreturn=False)
@@ -0,0 +1,61 @@
+import pygame
+from config import *
+from capture import capture
+
+class RenderTarget:
+    def __init__(self, size=(WIDTH, HEIGHT), mode=SCALE_MODE):
+        self.size = size
+        self.mode = mode
+        self.surface = pygame.Surface(size).convert()
+        self.window_size = None
+        self.scaled = None
+        self.offset = (0, 0)
+        self.fullscreen = False
+
+    def handle_event(self, event):
+        if event.type == pygame.VIDEORESIZE and not self.fullscreen:
+            pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
+        elif event.type == pygame.KEYDOWN and event.key == FULLSCREEN_KEY:
+            self.toggle_fullscreen()
+        elif event.type == pygame.KEYDOWN and event.key == CAPTURE_KEY:
+            capture.toggle(self.surface)
+
+    def toggle_fullscreen(self):
+        self.fullscreen = not self.fullscreen
+        if self.fullscreen:
+            pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        else:
+            pygame.display.set_mode(self.size, pygame.RESIZABLE)
+
+    def _resize(self, window):
+        self.window_size = window.get_size()
+        window_w, window_h = self.window_size
+        logical_w, logical_h = self.size
+
+        factor = min(window_w / logical_w, window_h / logical_h)
+        if self.mode == "integer" and factor >= 1:
+            factor = int(factor)
+        scaled_size = (max(1, int(logical_w * factor)), max(1, int(logical_h * factor)))
+
+        if scaled_size == self.size:
+            self.scaled = None
+        else:
+            self.scaled = pygame.Surface(scaled_size, 0, self.surface)
+        self.offset = ((window_w - scaled_size[0]) // 2, (window_h - scaled_size[1]) // 2)
+        window.fill(BLACK)
+
+    def present(self):
+        window = pygame.display.get_surface()
+        if window.get_size() != self.window_size:
+            self._resize(window)
+
+        if self.scaled is None:
+            window.blit(self.surface, self.offset)
+        else:
+            if self.mode == "integer" and self.scaled.get_width() >= self.size[0]:
+                pygame.transform.scale(self.surface, self.scaled.get_size(), self.scaled)
+            else:
+                pygame.transform.smoothscale(self.surface, self.scaled.get_size(), self.scaled)
+            window.blit(self.scaled, self.offset)
+        capture.frame(self.surface)
+        pygame.display.flip()
@@ -0,0 +1,66 @@
+import pygame
+from config import *
+from gamelog import log
+from assets import asset_store
+
+class SoundBank:
+    def __init__(self, paths=SOUND_ASSETS, channels=SOUND_CHANNELS, max_instances=SOUND_MAX_INSTANCES):
+        self.paths = paths
+        self.channel_counts = channels
+        self.max_instances = max_instances
+        self.sounds = {}
+        self.channels = {}
+        self.all_channels = []
+        self.started = {}
+        self.loaded = False
+
+    def load(self):
+        if self.loaded or not pygame.mixer.get_init():
+            return
+        self.loaded = True
+
+        for path in self.paths:
+            try:
+                self.sounds[path] = asset_store.sound(path)
+            except Exception as e:
+                log.warning("audio", "Could not load sound %s: %s", path, e)
+                self.sounds[path] = None
+
+        reserved = sum(self.channel_counts.values())
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), reserved))
+        pygame.mixer.set_reserved(reserved)
+
+        first = 0
+        for category, count in self.channel_counts.items():
+            self.channels[category] = [pygame.mixer.Channel(i) for i in range(first, first + count)]
+            self.started[category] = [0] * count
+            first += count
+        self.all_channels = [channel for channels in self.channels.values() for channel in channels]
+
+    def play(self, path, category, volume=1.0):
+        self.load()
+        sound = self.sounds.get(path)
+        if sound is None:
+            return None
+
+        playing = 0
+        for channel in self.all_channels:
+            if channel.get_sound() is sound:
+                playing += 1
+                if playing >= self.max_instances:
+                    return None
+
+        channels = self.channels[category]
+        started = self.started[category]
+        slot = next((i for i, c in enumerate(channels) if not c.get_busy()), None)
+        if slot is None:
+            slot = started.index(min(started))
+        channel = channels[slot]
+        started[slot] = pygame.time.get_ticks()
+
+        channel.play(sound)
+        channel.set_volume(volume)
+        return channel
+
+
+sound_bank = SoundBank()
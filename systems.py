@@ -0,0 +1,382 @@
+import pygame
+import random
+import math
+from config import *
+from enemy import spawn_enemy
+from patterns import fire_pattern
+from soundbank import sound_bank
+from telemetry import telemetry
+
+BOUNCE_FORCE = 1.2
+
+def update_world(world, players, dt):
+    targets = [player.rect.center for player in players if not player.dead] or [players[0].rect.center]
+    now = pygame.time.get_ticks()
+
+    animate(world, now)
+    rotate(world)
+    chase(world, targets, dt)
+    shoot(world, targets, now)
+    fire_patterns(world, targets, now)
+    steer_bouncers(world, dt)
+    move(world)
+    world.room.enemy_shots.step(targets)
+    world.room.particles.step(dt)
+    bounce_off_walls(world)
+    hit_walls(world)
+    expire(world)
+    follow(world)
+    sync_sprites(world)
+    hit_enemies(world)
+    effect = None
+    for player in players:
+        hit_player(world, player)
+        effect = pick_up(world, player) or effect
+
+    world.flush()
+    return effect
+
+def animate(world, now):
+    animation = world.animation
+    sprite_store = world.sprite
+    for clip, phase, eid in zip(animation.clip, animation.phase, animation.ids):
+        region = clip.frame_at(now + phase)
+        sprite = sprite_store.sprite[sprite_store.index[eid]]
+        if sprite.source_rect is not region.rect:
+            sprite.set_region(region)
+
+def rotate(world):
+    rotation = world.rotation
+    sprite_store = world.sprite
+    for slot, eid in enumerate(rotation.ids):
+        angle = rotation.angle[slot] + rotation.speed[slot]
+        rotation.angle[slot] = angle
+        images = rotation.images[slot]
+        region = images[int(round(angle / ROTATION_STEP)) % len(images)]
+        sprite = sprite_store.sprite[sprite_store.index[eid]]
+        if sprite.source_rect is not region.rect:
+            sprite.set_region(region)
+
+def chase(world, targets, dt):
+    chase_store = world.chase
+    transform = world.transform
+    velocity = world.velocity
+    flow_field = world.room.flow_field
+    for slot, eid in enumerate(chase_store.ids):
+        t = transform.index[eid]
+        x, y = transform.x[t], transform.y[t]
+
+        direction = flow_field.direction_at((x, y))
+        if direction is None:
+            target = nearest(targets, x, y)
+            dx = target[0] - x
+            dy = target[1] - y
+            dist = max(1, (dx**2 + dy**2) ** 0.5)
+            direction = (dx / dist, dy / dist)
+
+        step = chase_store.speed[slot] * (dt / 16)
+        v = velocity.index[eid]
+        velocity.vx[v] = direction[0] * step
+        velocity.vy[v] = direction[1] * step
+
+def nearest(targets, x, y):
+    return min(targets, key=lambda target: (target[0] - x) ** 2 + (target[1] - y) ** 2)
+
+def shoot(world, targets, now):
+    shooter = world.shooter
+    transform = world.transform
+    for slot, eid in enumerate(shooter.ids):
+        if now - shooter.last_shot[slot] <= shooter.interval[slot]:
+            continue
+        shooter.last_shot[slot] = now
+
+        t = transform.index[eid]
+        x, y = transform.x[t], transform.y[t]
+        target = nearest(targets, x, y)
+        dx = target[0] - x
+        dy = target[1] - y
+        dist = max(1, (dx**2 + dy**2) ** 0.5)
+        angle = math.degrees(math.atan2(dy, dx))
+
+        world.room.enemy_shots.emit(x, y, dx / dist, dy / dist, 90 + angle, homing=shooter.homing[slot])
+        sound_bank.play(SOUND_PLAYER_SHOOT, "enemy", 0.4)
+
+def fire_patterns(world, targets, now):
+    emitter = world.emitter
+    splitter = world.splitter
+    transform = world.transform
+    for slot, eid in enumerate(emitter.ids):
+        phases = emitter.phases[slot]
+        stage = len(splitter.get(eid, "done")) if eid in splitter else 0
+        phase = phases[min(stage, len(phases) - 1)]
+        if now - emitter.last_shot[slot] <= phase["interval"]:
+            continue
+        emitter.last_shot[slot] = now
+
+        t = transform.index[eid]
+        origin = (transform.x[t], transform.y[t])
+        target = nearest(targets, *origin)
+        emitter.spin[slot] = fire_pattern(world.room.enemy_shots, phase, origin, target, emitter.spin[slot])
+        sound_bank.play(SOUND_PLAYER_SHOOT, "enemy", 0.2)
+
+def steer_bouncers(world, dt):
+    bounce = world.bounce
+    velocity = world.velocity
+    for slot, eid in enumerate(bounce.ids):
+        v = velocity.index[eid]
+        vx = velocity.vx[v] + bounce.dir_x[slot] * bounce.acceleration[slot]
+        vy = velocity.vy[v] + bounce.dir_y[slot] * bounce.acceleration[slot]
+
+        max_speed = bounce.speed[slot] * (dt / 16)
+        speed = (vx**2 + vy**2) ** 0.5
+        if speed > max_speed:
+            vx = vx / speed * max_speed
+            vy = vy / speed * max_speed
+
+        velocity.vx[v] = vx
+        velocity.vy[v] = vy
+
+def move(world):
+    velocity = world.velocity
+    transform = world.transform
+    chase_store = world.chase
+    room = world.room
+    for slot, eid in enumerate(velocity.ids):
+        t = transform.index[eid]
+        x, y = transform.x[t], transform.y[t]
+        vx, vy = velocity.vx[slot], velocity.vy[slot]
+        if eid in chase_store:
+            hitbox = world.collider_rect(eid)
+            if not room.check_collision(hitbox):
+                hitbox.center = (int(x + vx), int(y))
+                if room.check_collision(hitbox):
+                    vx = 0
+                hitbox.center = (int(x + vx), int(y + vy))
+                if room.check_collision(hitbox):
+                    vy = 0
+        transform.x[t] = x + vx
+        transform.y[t] = y + vy
+
+def bounce_off_walls(world):
+    bounce = world.bounce
+    velocity = world.velocity
+    transform = world.transform
+    room = world.room
+    for slot, eid in enumerate(bounce.ids):
+        hitbox = world.collider_rect(eid)
+        v = velocity.index[eid]
+
+        if room.check_collision(hitbox):
+            if bounce.cooldown[slot] <= 0:
+                probe = world.sprite.get(eid, "sprite").rect.copy()
+                probe.center = hitbox.center
+                probe.x += bounce.dir_x[slot] * 5
+                if room.check_collision(probe):
+                    bounce.dir_x[slot] *= -1
+                    velocity.vx[v] *= -BOUNCE_FORCE
+
+                probe.center = hitbox.center
+                probe.y += bounce.dir_y[slot] * 5
+                if room.check_collision(probe):
+                    bounce.dir_y[slot] *= -1
+                    velocity.vy[v] *= -BOUNCE_FORCE
+
+                if random.random() < 0.3:
+                    bounce.dir_x[slot] += random.uniform(-0.5, 0.5)
+                    bounce.dir_y[slot] += random.uniform(-0.5, 0.5)
+
+                length = (bounce.dir_x[slot]**2 + bounce.dir_y[slot]**2) ** 0.5
+                if length > 0:
+                    bounce.dir_x[slot] /= length
+                    bounce.dir_y[slot] /= length
+                bounce.cooldown[slot] = 10
+            else:
+                bounce.cooldown[slot] -= 1
+
+        rect = world.sprite.get(eid, "sprite").rect.copy()
+        rect.center = hitbox.center
+        margin = 20
+        t = transform.index[eid]
+
+        if rect.left < room.rect.left + margin:
+            transform.x[t] += room.rect.left + margin - rect.left
+            bounce.dir_x[slot] = abs(bounce.dir_x[slot])
+            velocity.vx[v] = abs(velocity.vx[v])
+        if rect.right > room.rect.right - margin:
+            transform.x[t] -= rect.right - (room.rect.right - margin)
+            bounce.dir_x[slot] = -abs(bounce.dir_x[slot])
+            velocity.vx[v] = -abs(velocity.vx[v])
+        if rect.top < room.rect.top + margin:
+            transform.y[t] += room.rect.top + margin - rect.top
+            bounce.dir_y[slot] = abs(bounce.dir_y[slot])
+            velocity.vy[v] = abs(velocity.vy[v])
+        if rect.bottom > room.rect.bottom - margin:
+            transform.y[t] -= rect.bottom - (room.rect.bottom - margin)
+            bounce.dir_y[slot] = -abs(bounce.dir_y[slot])
+            velocity.vy[v] = -abs(velocity.vy[v])
+
+def hit_walls(world):
+    lifetime = world.lifetime
+    room = world.room
+    for slot, eid in enumerate(lifetime.ids):
+        rect = world.collider_rect(eid)
+        if room.check_collision(rect, TILE_BLOCKS_SHOTS):
+            sound_bank.play(SOUND_PROJECTILE_HIT, "player", 0.3)
+            room.particles.emit(rect.centerx, rect.centery, "hit")
+            lifetime.ttl[slot] = 0
+
+def expire(world):
+    lifetime = world.lifetime
+    for slot, eid in enumerate(lifetime.ids):
+        lifetime.ttl[slot] -= 1
+        if lifetime.ttl[slot] <= 0:
+            world.destroy(eid)
+
+def follow(world):
+    follow_store = world.follow
+    transform = world.transform
+    for slot, eid in enumerate(follow_store.ids):
+        target = follow_store.target[slot]
+        if not world.is_alive(target):
+            world.destroy(eid)
+            continue
+        t = transform.index[eid]
+        transform.x[t] = transform.get(target, "x")
+        transform.y[t] = transform.get(target, "y")
+
+def sync_sprites(world):
+    sprite_store = world.sprite
+    transform = world.transform
+    for slot, eid in enumerate(sprite_store.ids):
+        t = transform.index[eid]
+        sprite_store.sprite[slot].rect.center = (int(transform.x[t]), int(transform.y[t]))
+
+def entity_mask(world, eid):
+    region = world.sprite.get(eid, "sprite").region
+    return region.mask() if region else None
+
+def colliders_of(world, team):
+    collider = world.collider
+    if not PIXEL_COLLISION:
+        return [
+            (eid, world.collider_rect(eid), collider.contact_damage[slot], None)
+            for slot, eid in enumerate(collider.ids)
+            if collider.team[slot] == team and eid not in world.graveyard
+        ]
+
+    sprite_store = world.sprite
+    colliders = []
+    for slot, eid in enumerate(collider.ids):
+        if collider.team[slot] != team or eid in world.graveyard:
+            continue
+        if eid in sprite_store:
+            rect = sprite_store.sprite[sprite_store.index[eid]].rect
+            mask = entity_mask(world, eid)
+        else:
+            rect = world.collider_rect(eid)
+            mask = None
+        colliders.append((eid, rect, collider.contact_damage[slot], mask))
+    return colliders
+
+def touches(rect_a, mask_a, rect_b, mask_b):
+    if not rect_a.colliderect(rect_b):
+        return False
+    if mask_a is None or mask_b is None:
+        return True
+
+    width_a, height_a = mask_a.get_size()
+    width_b, height_b = mask_b.get_size()
+    offset = (rect_b.centerx - width_b // 2 - (rect_a.centerx - width_a // 2),
+              rect_b.centery - height_b // 2 - (rect_a.centery - height_a // 2))
+    return mask_a.overlap(mask_b, offset) is not None
+
+def player_mask(player):
+    return player.region.mask() if PIXEL_COLLISION else None
+
+def hit_enemies(world):
+    shots = colliders_of(world, TEAM_PLAYER_SHOT)
+    if not shots:
+        return
+
+    enemies = colliders_of(world, TEAM_ENEMY)
+    for shot, shot_rect, shot_damage, shot_mask in shots:
+        for enemy, enemy_rect, _, enemy_mask in enemies:
+            if world.is_alive(enemy) and touches(shot_rect, shot_mask, enemy_rect, enemy_mask):
+                world.room.particles.emit(shot_rect.centerx, shot_rect.centery, "hit")
+                damage(world, enemy, shot_damage)
+                world.destroy(shot)
+                break
+
+def hit_player(world, player):
+    if player.invincible or player.dead:
+        return
+
+    mask = player_mask(player)
+    for eid, rect, contact_damage, enemy_mask in colliders_of(world, TEAM_ENEMY):
+        if contact_damage and touches(rect, enemy_mask, player.rect, mask):
+            hurt_player(world, player, contact_damage)
+            return
+
+    if world.room.enemy_shots.collide(player.rect, mask):
+        hurt_player(world, player, 1)
+
+def hurt_player(world, player, amount):
+    player.take_damage(amount)
+    if player.dead:
+        world.room.particles.emit(player.rect.centerx, player.rect.centery, "explosion")
+
+def pick_up(world, player):
+    if player.dead:
+        return None
+
+    for eid, rect, _, _ in colliders_of(world, TEAM_ITEM):
+        if rect.colliderect(player.rect):
+            effect = world.pickup.get(eid, "effect")
+            item = world.pickup.get(eid, "type_name")
+            world.destroy(eid)
+            telemetry.emit("item_picked", item=item)
+            telemetry.count("items_picked")
+            if "win_game" in effect:
+                return effect
+            player.apply_item_effect(effect)
+    return None
+
+def damage(world, eid, amount):
+    health = world.health
+    slot = health.index[eid]
+    old_hp_percent = health.hp[slot] / health.max_hp[slot]
+    health.hp[slot] -= amount
+    new_hp_percent = health.hp[slot] / health.max_hp[slot]
+    dying = health.hp[slot] <= 0
+
+    if eid in world.splitter:
+        split(world, eid, old_hp_percent, new_hp_percent, dying)
+    elif dying:
+        world.room.particles.emit(world.transform.get(eid, "x"), world.transform.get(eid, "y"), "death")
+
+    if dying:
+        world.destroy(eid)
+
+def split(world, eid, old_hp_percent, new_hp_percent, dying):
+    splitter = world.splitter
+    slot = splitter.index[eid]
+    x, y = world.transform.get(eid, "x"), world.transform.get(eid, "y")
+    child_type = splitter.child_type[slot]
+    count = splitter.count[slot]
+
+    offsets = []
+    for threshold in splitter.thresholds[slot]:
+        if old_hp_percent > threshold >= new_hp_percent and threshold not in splitter.done[slot]:
+            splitter.done[slot].append(threshold)
+            offsets.extend((random.randint(-30, 30), random.randint(-30, 30)) for _ in range(count))
+    if dying:
+        offsets.extend([(0, 0)] * count)
+
+    if offsets:
+        telemetry.emit("boss_split", enemy=world.enemy.get(eid, "type_name"), into=child_type,
+                       count=len(offsets), final=dying)
+        world.room.particles.emit(x, y, "split")
+
+    for offset_x, offset_y in offsets:
+        angle = random.uniform(0, 2 * math.pi)
+        spawn_enemy(world, child_type, x + offset_x, y + offset_y, (math.cos(angle), math.sin(angle)))
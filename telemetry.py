@@ -0,0 +1,107 @@
+import json
+import time
+import uuid
+import queue
+import atexit
+import threading
+import pygame
+from config import *
+from gamelog import log
+
+class RunTelemetry:
+    def __init__(self, path=TELEMETRY_FILE, flush_interval=TELEMETRY_FLUSH_INTERVAL):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.queue = queue.SimpleQueue()
+        self.flush_lock = threading.Lock()
+        self.writer = None
+
+        self.run_id = None
+        self.started = 0
+        self.counters = {}
+        self.frame_histogram = [0] * TELEMETRY_FRAME_BUCKETS
+        self.frame_count = 0
+        self.frame_max = 0
+
+    def start_run(self):
+        self.run_id = uuid.uuid4().hex[:12]
+        self.started = pygame.time.get_ticks()
+        self.counters = {}
+        self.frame_histogram = [0] * TELEMETRY_FRAME_BUCKETS
+        self.frame_count = 0
+        self.frame_max = 0
+        self.emit("run_start")
+
+    def end_run(self, result, elapsed):
+        if self.run_id is None:
+            return
+        self.emit("run_end", result=result, elapsed=elapsed,
+                  frame_ms=self.frame_percentiles(), **self.counters)
+        self.run_id = None
+
+    def emit(self, event, **data):
+        if self.run_id is None:
+            return
+        data["run"] = self.run_id
+        data["event"] = event
+        data["t"] = pygame.time.get_ticks() - self.started
+        self.queue.put(data)
+        if self.writer is None:
+            self._start_writer()
+
+    def count(self, name, amount=1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def frame(self, dt):
+        dt = int(dt)
+        self.frame_histogram[min(max(dt, 0), TELEMETRY_FRAME_BUCKETS - 1)] += 1
+        self.frame_count += 1
+        self.frame_max = max(self.frame_max, dt)
+
+    def frame_percentile(self, percent):
+        target = (self.frame_count - 1) * percent // 100
+        seen = 0
+        for bucket, count in enumerate(self.frame_histogram):
+            seen += count
+            if seen > target:
+                return bucket if bucket < TELEMETRY_FRAME_BUCKETS - 1 else self.frame_max
+        return self.frame_max
+
+    def frame_percentiles(self):
+        if not self.frame_count:
+            return {}
+        return {
+            "p50": self.frame_percentile(50),
+            "p95": self.frame_percentile(95),
+            "p99": self.frame_percentile(99),
+            "max": self.frame_max,
+        }
+
+    def _start_writer(self):
+        self.writer = threading.Thread(target=self._run, name="telemetry-writer", daemon=True)
+        self.writer.start()
+        atexit.register(self.flush)
+
+    def _run(self):
+        while True:
+            time.sleep(self.flush_interval)
+            self.flush()
+
+    def flush(self):
+        with self.flush_lock:
+            lines = []
+            while True:
+                try:
+                    lines.append(json.dumps(self.queue.get_nowait()))
+                except queue.Empty:
+                    break
+            if not lines:
+                return
+            try:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write("\n".join(lines) + "\n")
+            except OSError as e:
+                log.warning("telemetry", "Could not write telemetry: %s", e)
+
+
+telemetry = RunTelemetry()